@@ -21,10 +21,10 @@ logger = logging.getLogger(__name__)
 
 # Abbreviations that end with a period but are NOT sentence boundaries.
 # Covers Indonesian and English common abbreviations.
-_ABBREVIATIONS = {
+_ABBREVIATIONS = frozenset({
     "dr", "mr", "mrs", "ms", "prof", "jr", "sr", "vs", "etc", "inc", "ltd",
     "dll", "dsb", "dkk", "spt", "yth", "no", "vol", "hal", "tel", "fax",
-}
+})
 
 # Regex: split on sentence-ending punctuation (. ! ?) followed by whitespace,
 # but keep the punctuation attached to the preceding sentence.
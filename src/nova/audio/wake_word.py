@@ -7,15 +7,17 @@ Uses pynput keyboard hotkey listener as a cross-platform fallback
 import asyncio
 import io
 import logging
-import math
-import struct
 import wave
+from functools import lru_cache
+
+import numpy as np
 
 from nova.config import get_config
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
 def generate_beep(
     frequency: float = 440.0,
     duration: float = 0.2,
@@ -24,6 +26,9 @@ def generate_beep(
 ) -> bytes:
     """Generate a short sine-wave activation beep as WAV bytes.
 
+    Cached per parameter set; the result is immutable bytes, so every
+    detector shares one copy.
+
     Args:
         frequency: Tone frequency in Hz.
         duration: Duration in seconds.
@@ -34,25 +39,21 @@ def generate_beep(
         WAV-encoded audio bytes.
     """
     num_samples = int(sample_rate * duration)
-    samples = []
-    for i in range(num_samples):
-        t = i / sample_rate
-        # Apply a short fade-in/out to avoid clicks
-        envelope = 1.0
-        fade_samples = int(sample_rate * 0.01)  # 10ms fade
-        if i < fade_samples:
-            envelope = i / fade_samples
-        elif i > num_samples - fade_samples:
-            envelope = (num_samples - i) / fade_samples
-        value = volume * envelope * math.sin(2.0 * math.pi * frequency * t)
-        samples.append(int(value * 32767))
+    i = np.arange(num_samples, dtype=np.float64)
+    # Apply a short fade-in/out to avoid clicks
+    envelope = np.ones(num_samples)
+    fade_samples = int(sample_rate * 0.01)  # 10ms fade
+    if fade_samples:
+        envelope = np.minimum(np.minimum(i, num_samples - i) / fade_samples, 1.0)
+    values = volume * envelope * np.sin(2.0 * np.pi * frequency * i / sample_rate)
+    samples = (values * 32767).astype("<i2")
 
     buffer = io.BytesIO()
     with wave.open(buffer, "wb") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(sample_rate)
-        wf.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+        wf.writeframes(samples.tobytes())
     return buffer.getvalue()
 
 
@@ -8,6 +8,7 @@ synthesized at runtime. Playback via sounddevice or temp wav fallback.
 import logging
 import tempfile
 import wave
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -15,6 +16,67 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _envelope(n_samples: int, attack: int, release: int) -> np.ndarray:
+    """Return a linear attack → sustain → release envelope.
+
+    Cached per shape and shared between calls, so the returned array
+    is read-only.
+
+    Args:
+        n_samples: Total envelope length.
+        attack: Number of fade-in samples.
+        release: Number of fade-out samples.
+
+    Returns:
+        float32 envelope array (0.0–1.0).
+    """
+    env = np.ones(n_samples, dtype=np.float32)
+    env[:attack] = np.linspace(0, 1, attack, dtype=np.float32)
+    env[n_samples - release:] = np.linspace(1, 0, release, dtype=np.float32)
+    env.flags.writeable = False
+    return env
+
+
+@lru_cache(maxsize=8)
+def _sine_table(n_samples: int, freq: float, sample_rate: int) -> np.ndarray:
+    """Return ``n_samples`` of a unit sine wave at ``freq`` Hz.
+
+    Cached per (length, frequency, sample rate) and read-only.
+
+    Args:
+        n_samples: Number of samples.
+        freq: Frequency in Hz.
+        sample_rate: Audio sample rate in Hz.
+
+    Returns:
+        float32 sine array (-1.0–1.0).
+    """
+    table = np.arange(n_samples, dtype=np.float32)
+    table *= np.float32(2 * np.pi * freq / sample_rate)
+    np.sin(table, out=table)
+    table.flags.writeable = False
+    return table
+
+
+def _to_int16(
+    tone: np.ndarray, envelope: np.ndarray, volume: float,
+) -> np.ndarray:
+    """Apply envelope and volume to a float32 tone and cast to int16.
+
+    Args:
+        tone: Scratch float32 tone buffer (modified in place).
+        envelope: Amplitude envelope, same length as ``tone``.
+        volume: Volume multiplier (0.0–1.0).
+
+    Returns:
+        Audio data as int16 numpy array.
+    """
+    tone *= envelope
+    tone *= np.float32(volume * 32767)
+    return tone.astype(np.int16)
+
+
 def generate_chime(
     sample_rate: int = 22050,
     volume: float = 0.3,
@@ -30,23 +92,19 @@ def generate_chime(
     """
     duration = 0.6  # seconds
     n_samples = int(sample_rate * duration)
-    t = np.linspace(0, duration, n_samples, dtype=np.float64)
     half = n_samples // 2
 
     # Two ascending notes: C5 (523 Hz) → E5 (659 Hz)
-    note1 = np.sin(2 * np.pi * 523 * t[:half]) * volume
-    note2 = np.sin(2 * np.pi * 659 * t[half:]) * volume
+    tone = np.concatenate([
+        _sine_table(n_samples, 523.0, sample_rate)[:half],
+        _sine_table(n_samples, 659.0, sample_rate)[half:],
+    ])
 
     # Smooth envelope (fade in → sustain → fade out)
     quarter = n_samples // 4
-    envelope = np.concatenate([
-        np.linspace(0, 1, quarter),
-        np.ones(quarter),
-        np.linspace(1, 0, n_samples - 2 * quarter),
-    ])[:n_samples]
+    envelope = _envelope(n_samples, quarter, n_samples - 2 * quarter)
 
-    audio = np.concatenate([note1, note2]) * envelope
-    return (audio * 32767).astype(np.int16)
+    return _to_int16(tone, envelope, volume)
 
 
 def generate_alert(
@@ -64,26 +122,20 @@ def generate_alert(
     """
     duration = 1.0  # seconds
     n_samples = int(sample_rate * duration)
-    t = np.linspace(0, duration, n_samples, dtype=np.float64)
 
-    # Alternating tones: A5 (880 Hz) and E5 (660 Hz)
-    freq = np.where(
-        (t * 4).astype(int) % 2 == 0,
-        880.0,  # A5
-        660.0,  # E5
+    # Alternating tones every quarter second: A5 (880 Hz) and E5 (660 Hz)
+    quarter_index = np.arange(n_samples) * 4 // sample_rate
+    tone = np.where(
+        quarter_index % 2 == 0,
+        _sine_table(n_samples, 880.0, sample_rate),
+        _sine_table(n_samples, 660.0, sample_rate),
     )
-    audio = np.sin(2 * np.pi * freq * t) * volume
 
     # Envelope: quick attack, long sustain, short release
     eighth = n_samples // 8
-    envelope = np.concatenate([
-        np.linspace(0, 1, eighth),
-        np.ones(n_samples - 2 * eighth),
-        np.linspace(1, 0, eighth),
-    ])[:n_samples]
-
-    audio = (audio * envelope * 32767).astype(np.int16)
-    return audio
+    envelope = _envelope(n_samples, eighth, eighth)
+
+    return _to_int16(tone, envelope, volume)
 
 
 def play_notification_sound(
@@ -6,6 +6,9 @@ and active (alert + speak immediately).
 """
 
 import threading
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from enum import IntEnum
@@ -19,9 +22,17 @@ class Urgency(IntEnum):
     ACTIVE = 3    # play alert + speak immediately
 
 
-@dataclass
+# Urgent levels, highest first — scanned by get_next_urgent()/has_urgent()
+_URGENT_LEVELS = (Urgency.ACTIVE, Urgency.GENTLE)
+
+
+@dataclass(slots=True)
 class Notification:
-    """A single notification in the heartbeat queue."""
+    """A single notification in the heartbeat queue.
+
+    Mutable on purpose: delivery retries bump ``attempts`` and may
+    downgrade ``urgency`` before re-queueing.
+    """
 
     message: str
     urgency: Urgency
@@ -33,51 +44,76 @@ class Notification:
 
 
 class NotificationQueue:
-    """Thread-safe notification queue for heartbeat notifications."""
+    """Thread-safe notification queue for heartbeat notifications.
+
+    Notifications are kept in one deque per urgency level, each ordered
+    oldest-first by ``created_at``, so push and pop are O(1) in the usual
+    case where notifications arrive in time order.
+    """
 
     def __init__(self) -> None:
-        self._queue: list[Notification] = []
+        self._buckets: dict[Urgency, deque[Notification]] = {
+            u: deque() for u in Urgency
+        }
         self._lock = threading.Lock()
 
+    def _insert(self, notification: Notification) -> None:
+        """Place a notification in its bucket. Caller must hold the lock."""
+        bucket = self._buckets[notification.urgency]
+        if not bucket or bucket[-1].created_at <= notification.created_at:
+            bucket.append(notification)
+        else:
+            # Out-of-order timestamp: keep the bucket oldest-first
+            idx = bisect_right(
+                bucket, notification.created_at, key=lambda n: n.created_at,
+            )
+            bucket.insert(idx, notification)
+
     def push(self, notification: Notification) -> None:
         """Add a notification to the queue."""
         with self._lock:
-            self._queue.append(notification)
+            self._insert(notification)
+
+    def push_many(self, notifications: Iterable[Notification]) -> None:
+        """Add several notifications while taking the lock only once."""
+        with self._lock:
+            for notification in notifications:
+                self._insert(notification)
 
     def get_passive(self) -> list[Notification]:
         """Get and remove all PASSIVE notifications."""
         with self._lock:
-            passive = [n for n in self._queue if n.urgency == Urgency.PASSIVE]
-            self._queue = [n for n in self._queue if n.urgency != Urgency.PASSIVE]
+            bucket = self._buckets[Urgency.PASSIVE]
+            passive = list(bucket)
+            bucket.clear()
             return passive
 
     def get_next_urgent(self) -> Notification | None:
         """Get and remove the highest urgency GENTLE/ACTIVE notification."""
         with self._lock:
-            urgent = [n for n in self._queue if n.urgency >= Urgency.GENTLE]
-            if not urgent:
-                return None
-            urgent.sort(key=lambda n: (-n.urgency, n.created_at))
-            notif = urgent[0]
-            self._queue.remove(notif)
-            return notif
+            for urgency in _URGENT_LEVELS:
+                bucket = self._buckets[urgency]
+                if bucket:
+                    return bucket.popleft()
+            return None
 
     def has_urgent(self) -> bool:
         """Check if there are any GENTLE or ACTIVE notifications."""
         with self._lock:
-            return any(n.urgency >= Urgency.GENTLE for n in self._queue)
+            return any(self._buckets[u] for u in _URGENT_LEVELS)
 
     def is_empty(self) -> bool:
         """Check if the queue is empty."""
         with self._lock:
-            return len(self._queue) == 0
+            return not any(self._buckets.values())
 
     def size(self) -> int:
         """Return the number of notifications in the queue."""
         with self._lock:
-            return len(self._queue)
+            return sum(len(b) for b in self._buckets.values())
 
     def clear(self) -> None:
         """Remove all notifications from the queue."""
         with self._lock:
-            self._queue.clear()
+            for bucket in self._buckets.values():
+                bucket.clear()
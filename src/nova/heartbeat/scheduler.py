@@ -41,6 +41,11 @@ class HeartbeatScheduler:
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
 
+        # Completed loop iterations; the event is set after each one so
+        # callers (and tests) can wait for a tick instead of sleeping
+        self._tick_count = 0
+        self._tick_event = threading.Event()
+
         # Daily flags
         self._morning_greeted = False
         self._sleep_reminded = False
@@ -80,6 +85,8 @@ class HeartbeatScheduler:
                 self._tick()
             except Exception:
                 logger.exception("Heartbeat tick failed")
+            self._tick_count += 1
+            self._tick_event.set()
             self._stop_event.wait(self._config.heartbeat_interval)
 
     def _tick(self) -> None:
@@ -94,12 +101,13 @@ class HeartbeatScheduler:
     def _check_reminders(self, now: datetime) -> None:
         """Find due reminders and push to notification queue."""
         pending = self._store.get_pending_reminders(now, window_minutes=2)
+        quiet = self._is_quiet_hour(now.hour)
 
         for r in pending:
             urgency = Urgency(r["urgency"])
 
             # Quiet hours: downgrade non-alarm to PASSIVE
-            if self._is_quiet(now) and not r["is_alarm"]:
+            if quiet and not r["is_alarm"]:
                 urgency = Urgency.PASSIVE
 
             # Ambient noise gate: very quiet → likely away/sleeping
@@ -173,7 +181,10 @@ class HeartbeatScheduler:
 
     def _is_quiet(self, now: datetime) -> bool:
         """Check if current time is within quiet hours."""
-        hour = now.hour
+        return self._is_quiet_hour(now.hour)
+
+    def _is_quiet_hour(self, hour: int) -> bool:
+        """Check if an hour of the day (0-23) falls within quiet hours."""
         return hour >= self._config.quiet_hours_start or hour < self._config.quiet_hours_end
 
     def _maybe_reset_daily_flags(self, now: datetime) -> None:
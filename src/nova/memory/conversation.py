@@ -45,6 +45,10 @@ class ConversationManager:
         self._llm_fn = llm_fn
         self._history: list[dict] = []
         self._session_id: int | None = None
+        # Compaction summary, kept out of _history so it forms a stable
+        # leading turn that only changes when the next compaction runs
+        # (keeps the LLM's implicit prompt cache warm between turns).
+        self._summary_turn: dict | None = None
 
         # Load recent turns from today on startup
         self._load_recent()
@@ -70,7 +74,7 @@ class ConversationManager:
         """End the current session."""
         if self._session_id is not None:
             token_count = sum(
-                len(t.get("content", "")) // 4 for t in self._history
+                len(t.get("content", "")) // 4 for t in self.get_context()
             )
             self._store.end_session(
                 self._session_id, summary=summary,
@@ -119,20 +123,27 @@ class ConversationManager:
     def get_context(self) -> list[dict]:
         """Return the current conversation context.
 
+        If a compaction has happened, its summary is always the first
+        turn so the context prefix stays byte-identical across calls
+        until the next compaction.
+
         Returns:
             List of {"role": "user"|"assistant", "content": str} dicts.
         """
-        return list(self._history)
+        if self._summary_turn is None:
+            return list(self._history)
+        return [self._summary_turn, *self._history]
 
     def clear(self) -> None:
         """Reset the conversation history."""
         self._history.clear()
+        self._summary_turn = None
         logger.debug("Conversation cleared")
 
     @property
     def turn_count(self) -> int:
         """Number of messages currently in the window."""
-        return len(self._history)
+        return len(self._history) + (self._summary_turn is not None)
 
     async def _compact(self) -> None:
         """Compact the conversation by summarizing old turns.
@@ -141,11 +152,14 @@ class ConversationManager:
         1. Summarize the oldest COMPACT_AT*2 messages via LLM
         2. Write summary to the daily log
         3. Auto-extract facts from the conversation
-        4. Replace old messages with a summary bridge
+        4. Replace old messages with a summary bridge turn
         """
         compact_count = self.COMPACT_AT * 2
         old = self._history[:compact_count]
         recent = self._history[compact_count:]
+        if self._summary_turn is not None:
+            # Fold the previous summary into the next one
+            old = [self._summary_turn, *old]
 
         text = "\n".join(
             f"{t['role']}: {t['content']}" for t in old
@@ -184,16 +198,12 @@ class ConversationManager:
         # Write daily log
         self._append_daily_log(summary)
 
-        # Replace history with summary bridge + recent turns
-        self._history = [
-            {
-                "role": "system",
-                "content": (
-                    f"[Ringkasan percakapan sebelumnya: {summary}]"
-                ),
-            },
-            *recent,
-        ]
+        # Replace old turns with the summary bridge; recent turns stay
+        self._summary_turn = {
+            "role": "user",
+            "content": f"[Ringkasan percakapan sebelumnya: {summary}]",
+        }
+        self._history = recent
 
         logger.info(
             "Compacted %d turns → summary (%d chars) + %d recent",
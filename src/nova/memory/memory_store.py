@@ -6,14 +6,19 @@ vector embeddings for hybrid retrieval.
 """
 
 import asyncio
+import atexit
 import json
 import logging
 import re
 import sqlite3
-import struct
-from datetime import datetime
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 _MEMORY_DIR = Path.home() / ".nova" / "memory"
@@ -21,9 +26,42 @@ _DB_PATH = _MEMORY_DIR / "nova.db"
 _LEGACY_JSON = Path.home() / ".nova" / "memory.json"
 _MEMORY_MD = _MEMORY_DIR / "MEMORY.md"
 
+# Seconds to wait after a memory change before rewriting MEMORY.md, so a
+# burst of changes costs one file write
+_MD_SYNC_DELAY = 0.1
+
 # Module-level singleton
 _instance: "MemoryStore | None" = None
 
+# Connection pragmas per durability level; "off" drops the fsyncs and the
+# on-disk rollback journal, for stores whose contents are disposable (tests)
+_DURABILITY_PRAGMAS = {
+    "normal": ("PRAGMA journal_mode=WAL",),
+    "off": (
+        "PRAGMA journal_mode=MEMORY",
+        "PRAGMA synchronous=OFF",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_spill=OFF",
+        "PRAGMA cache_size=-8000",
+    ),
+}
+
+# Recurrence steps for schedule_next_recurrence()
+_DAILY = timedelta(days=1)
+_WEEKLY = timedelta(days=7)
+# Days to the next weekday, indexed by weekday() (Fri → Mon is 3)
+_WEEKDAY_DELTA = tuple(timedelta(days=d) for d in (1, 1, 1, 1, 3, 2, 1))
+
+
+def _embedding_blob(vec) -> bytes:
+    """Serialize an embedding (list or array of floats) as raw float32 bytes."""
+    return np.asarray(vec, dtype=np.float32).tobytes()
+
+
+def _notify_epoch(remind_at: str, lead_time: int) -> int:
+    """Unix time at which a reminder becomes due (remind_at - lead_time)."""
+    return int(datetime.fromisoformat(remind_at).timestamp()) - lead_time * 60
+
 
 def _sanitize_fts_query(query: str) -> str:
     """Remove FTS5 special characters, keep words only.
@@ -93,7 +131,8 @@ CREATE TABLE IF NOT EXISTS reminders (
     recurring   TEXT,
     delivered   BOOLEAN DEFAULT 0,
     created_at  TEXT NOT NULL,
-    delivered_at TEXT
+    delivered_at TEXT,
+    notify_at_epoch INTEGER  -- remind_at - lead_time, unix seconds
 );
 
 CREATE INDEX IF NOT EXISTS idx_reminders_pending
@@ -159,32 +198,84 @@ class MemoryStore:
     session tracking. Automatically migrates from legacy memory.json.
     """
 
-    def __init__(self, db_path: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        sync_memory_md: bool = True,
+        durability: str = "normal",
+    ) -> None:
         """Initialize the memory store.
 
         Args:
             db_path: Path to the SQLite database file.
                      Defaults to ~/.nova/memory/nova.db.
+                     ":memory:" opens a private in-memory database
+                     (no files are written, including MEMORY.md).
+            sync_memory_md: Keep MEMORY.md next to the database in sync
+                            with memory changes (debounced, see
+                            flush_memory_md()). Tests that don't check
+                            the mirror turn this off.
+            durability: "normal" (WAL journal) or "off" (no fsync,
+                        in-memory journal; a crash can corrupt the file).
+
+        Raises:
+            ValueError: If durability is not a known level.
         """
+        if durability not in _DURABILITY_PRAGMAS:
+            raise ValueError(f"Unknown durability level: {durability!r}")
+        self._durability = durability
         if db_path is None:
             self._db_path = _DB_PATH
         else:
             self._db_path = Path(db_path)
+        self._in_memory = str(self._db_path) == ":memory:"
+        self._md_sync_enabled = sync_memory_md and not self._in_memory
 
-        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self._in_memory:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(
             str(self._db_path),
             check_same_thread=False,
         )
+        self._configure()
+        self._init_schema()
+        self._migrate_legacy_json()
+
+    def _configure(self) -> None:
+        """Set connection options and per-instance state for a fresh store."""
         self._conn.row_factory = sqlite3.Row
-        self._conn.execute("PRAGMA journal_mode=WAL")
+        for pragma in _DURABILITY_PRAGMAS[self._durability]:
+            self._conn.execute(pragma)
         self._conn.execute("PRAGMA foreign_keys=ON")
 
         # Optional async embedding function: async fn(text) -> list[float] | None
         self._embedding_fn = None
 
-        self._init_schema()
-        self._migrate_legacy_json()
+        # batch() nesting depth; MEMORY.md sync is deferred while > 0
+        self._batch_depth = 0
+
+        # Pending MEMORY.md rewrite: set by _sync_memory_md(), cleared by
+        # flush_memory_md() when the debounce timer fires
+        self._md_dirty = False
+        self._md_timer: threading.Timer | None = None
+        self._md_lock = threading.Lock()
+
+    def clone_in_memory(self) -> "MemoryStore":
+        """Return an independent in-memory copy of this store's database.
+
+        Copies pages with sqlite3's backup API, so the schema, FTS5 tables
+        and triggers come along without re-running any DDL. Used by tests
+        to stamp out fresh stores from a prepared template.
+        """
+        clone = type(self).__new__(type(self))
+        clone._db_path = Path(":memory:")
+        clone._in_memory = True
+        clone._durability = self._durability
+        clone._md_sync_enabled = False
+        clone._conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self._conn.backup(clone._conn)
+        clone._configure()
+        return clone
 
     def _init_schema(self) -> None:
         """Create tables, indexes, FTS5 virtual tables, and triggers."""
@@ -199,9 +290,47 @@ class MemoryStore:
                 self._conn.execute(stmt)
             except sqlite3.OperationalError:
                 pass  # Already exists
+        self._migrate_reminder_epochs()
         self._conn.commit()
         logger.info("Memory store initialized: %s", self._db_path)
 
+    def _migrate_reminder_epochs(self) -> None:
+        """Add and backfill reminders.notify_at_epoch on older databases."""
+        columns = {
+            row["name"]
+            for row in self._conn.execute("PRAGMA table_info(reminders)")
+        }
+        if "notify_at_epoch" not in columns:
+            self._conn.execute(
+                "ALTER TABLE reminders ADD COLUMN notify_at_epoch INTEGER"
+            )
+        rows = self._conn.execute(
+            "SELECT id, remind_at, lead_time FROM reminders "
+            "WHERE notify_at_epoch IS NULL"
+        ).fetchall()
+        backfill = []
+        for r in rows:
+            try:
+                epoch = _notify_epoch(r["remind_at"], r["lead_time"])
+            except (TypeError, ValueError):
+                # Left NULL, so the reminder never comes due (as before)
+                logger.warning(
+                    "Reminder #%d has unparseable remind_at %r; not backfilled",
+                    r["id"], r["remind_at"],
+                )
+                continue
+            backfill.append((epoch, r["id"]))
+        if backfill:
+            self._conn.executemany(
+                "UPDATE reminders SET notify_at_epoch = ? WHERE id = ?",
+                backfill,
+            )
+            logger.info("Backfilled notify_at_epoch for %d reminders", len(backfill))
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_reminders_due "
+            "ON reminders(notify_at_epoch) WHERE delivered = 0"
+        )
+
     def _migrate_legacy_json(self) -> None:
         """Migrate facts from ~/.nova/memory.json to SQLite if present."""
         json_path = _LEGACY_JSON
@@ -242,6 +371,52 @@ class MemoryStore:
         except (json.JSONDecodeError, OSError) as e:
             logger.warning("Legacy JSON migration failed: %s", e)
 
+    # --- Transactions ---
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several writes into a single transaction.
+
+        Inside the block, store_memory(), add_reminder() and the other
+        write methods skip their own commits and MEMORY.md syncs. The
+        whole batch is committed once on exit (and one MEMORY.md rewrite
+        scheduled), or rolled back if the block raises. Nested batches join
+        the outermost one.
+
+        Example::
+
+            with store.batch():
+                store.store_memory("a", "1")
+                store.store_memory("b", "2")
+        """
+        # Depth changes under _md_lock so the MEMORY.md timer thread never
+        # reads the connection while a batch transaction is open
+        with self._md_lock:
+            outermost = self._batch_depth == 0
+            if outermost and not self._conn.in_transaction:
+                self._conn.execute("BEGIN IMMEDIATE")
+            self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            if outermost:
+                self._conn.rollback()
+            raise
+        else:
+            if outermost:
+                self._conn.commit()
+        finally:
+            with self._md_lock:
+                self._batch_depth -= 1
+
+        if outermost and self._md_dirty:
+            self._sync_memory_md()
+
+    def _commit(self) -> None:
+        """Commit the current write, unless batch() will commit it later."""
+        if not self._batch_depth:
+            self._conn.commit()
+
     # --- Memory CRUD ---
 
     def set_embedding_fn(self, fn) -> None:
@@ -284,7 +459,7 @@ class MemoryStore:
                 "VALUES (?, ?, ?, ?, ?)",
                 (key, value, source, now, now),
             )
-        self._conn.commit()
+        self._commit()
         self._sync_memory_md()
         logger.info("Memory stored: %s=%s (source=%s)", key, value, source)
 
@@ -296,17 +471,52 @@ class MemoryStore:
             except RuntimeError:
                 pass  # No running loop — skip embedding
 
+    def bulk_store_memories(
+        self, items: list[tuple[str, str]], source: str = "user",
+    ) -> None:
+        """Store or update many facts in a single transaction.
+
+        Same semantics as store_memory() per item, but with one commit and
+        one MEMORY.md sync for the whole batch.
+
+        Args:
+            items: (key, value) pairs.
+            source: Origin — "user", "auto", or "system".
+        """
+        now = datetime.now().isoformat()
+        rows = [(k.strip().lower(), v.strip(), source, now, now) for k, v in items]
+        if not rows:
+            return
+        with self.batch():
+            self._conn.executemany(
+                "INSERT INTO memories (key, value, source, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value=excluded.value, "
+                "source=excluded.source, updated_at=excluded.updated_at",
+                rows,
+            )
+        self._sync_memory_md()
+        logger.info("Memories stored in bulk: %d (source=%s)", len(rows), source)
+
+        if self._embedding_fn is not None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return  # No running loop — skip embedding
+            for key, value, *_ in rows:
+                loop.create_task(self._embed_memory(key, value))
+
     async def _embed_memory(self, key: str, value: str) -> None:
         """Generate and store embedding for a memory value."""
         try:
             vec = await self._embedding_fn(value)
             if vec is not None:
-                blob = struct.pack(f"{len(vec)}f", *vec)
+                blob = _embedding_blob(vec)
                 self._conn.execute(
                     "UPDATE memories SET embedding = ? WHERE key = ?",
                     (blob, key),
                 )
-                self._conn.commit()
+                self._commit()
                 logger.info("Embedded memory: %s (%d dimensions)", key, len(vec))
         except Exception:
             logger.warning("Failed to embed memory %s", key, exc_info=True)
@@ -350,7 +560,7 @@ class MemoryStore:
         cursor = self._conn.execute(
             "DELETE FROM memories WHERE key = ?", (key,),
         )
-        self._conn.commit()
+        self._commit()
         if cursor.rowcount > 0:
             self._sync_memory_md()
             logger.info("Memory deleted: %s", key)
@@ -429,7 +639,7 @@ class MemoryStore:
                 now.isoformat(),
             ),
         )
-        self._conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_recent_interactions(
@@ -505,7 +715,7 @@ class MemoryStore:
         cursor = self._conn.execute(
             "INSERT INTO sessions (started_at) VALUES (?)", (now,),
         )
-        self._conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def end_session(
@@ -517,46 +727,51 @@ class MemoryStore:
             "UPDATE sessions SET ended_at=?, summary=?, token_count=? WHERE id=?",
             (now, summary, token_count, session_id),
         )
-        self._conn.commit()
+        self._commit()
 
     # --- Embedding support ---
 
-    def store_embedding(self, key: str, embedding: list[float]) -> None:
+    def store_embedding(
+        self, key: str, embedding: "list[float] | np.ndarray",
+    ) -> None:
         """Store an embedding vector for a memory.
 
         Args:
             key: Memory key to attach the embedding to.
-            embedding: List of float values (e.g. 768-dim vector).
+            embedding: Float values (e.g. 768-dim vector) as a list or
+                       array; stored as raw float32 bytes.
         """
-        blob = struct.pack(f"{len(embedding)}f", *embedding)
+        blob = _embedding_blob(embedding)
         self._conn.execute(
             "UPDATE memories SET embedding = ? WHERE key = ?",
             (blob, key.strip().lower()),
         )
-        self._conn.commit()
+        self._commit()
 
     def get_memories_with_embeddings(self) -> list[dict]:
         """Get all memories that have embeddings stored.
 
+        Embeddings are decoded zero-copy into read-only float32 arrays
+        rather than Python float lists.
+
         Returns:
-            List of dicts with id, key, value, updated_at, embedding (as list[float]).
+            List of dicts with id, key, value, updated_at,
+            embedding (as np.ndarray of float32).
         """
         rows = self._conn.execute(
             "SELECT id, key, value, updated_at, embedding "
             "FROM memories WHERE embedding IS NOT NULL",
         ).fetchall()
-        results = []
-        for row in rows:
-            emb_blob = row["embedding"]
-            emb = list(struct.unpack(f"{len(emb_blob) // 4}f", emb_blob))
-            results.append({
+        return [
+            {
                 "id": row["id"],
                 "key": row["key"],
                 "value": row["value"],
                 "updated_at": row["updated_at"],
-                "embedding": emb,
-            })
-        return results
+                "embedding": np.frombuffer(row["embedding"], dtype=np.float32),
+            }
+            for row in rows
+        ]
 
     async def backfill_embeddings(
         self, embedding_fn=None,
@@ -586,12 +801,12 @@ class MemoryStore:
             try:
                 vec = await fn(row["value"])
                 if vec is not None:
-                    blob = struct.pack(f"{len(vec)}f", *vec)
+                    blob = _embedding_blob(vec)
                     self._conn.execute(
                         "UPDATE memories SET embedding = ? WHERE key = ?",
                         (blob, row["key"]),
                     )
-                    self._conn.commit()
+                    self._commit()
                     count += 1
             except Exception:
                 logger.warning(
@@ -604,12 +819,41 @@ class MemoryStore:
     # --- MEMORY.md sync ---
 
     def _sync_memory_md(self) -> None:
-        """Write a human-readable mirror of all memories to MEMORY.md."""
-        try:
-            memories = self.get_all_memories()
-            if not memories:
+        """Schedule a rewrite of MEMORY.md after a memory change.
+
+        The file is written _MD_SYNC_DELAY seconds after the first change
+        of a burst, so consecutive writes share a single rewrite.
+        """
+        if not self._md_sync_enabled:
+            return
+        with self._md_lock:
+            self._md_dirty = True
+            if self._batch_depth or self._md_timer is not None:
+                return  # batch() exit or the pending timer will write it
+            timer = threading.Timer(_MD_SYNC_DELAY, self.flush_memory_md)
+            timer.daemon = True
+            self._md_timer = timer
+            timer.start()
+
+    def flush_memory_md(self) -> None:
+        """Write a pending MEMORY.md update now instead of waiting."""
+        with self._md_lock:
+            if self._md_timer is not None:
+                self._md_timer.cancel()
+                self._md_timer = None
+            if not self._md_dirty or self._batch_depth:
                 return
+            self._md_dirty = False
+            # Snapshot under the lock: batch() can't open a transaction
+            # until it is released
+            memories = self.get_all_memories()
+        self._write_memory_md(memories)
 
+    def _write_memory_md(self, memories: dict[str, str]) -> None:
+        """Write a human-readable mirror of ``memories`` to MEMORY.md."""
+        if not memories:
+            return
+        try:
             lines = ["# NOVA Memory\n", ""]
             for key, value in memories.items():
                 lines.append(f"- **{key}**: {value}")
@@ -648,17 +892,50 @@ class MemoryStore:
         cursor = self._conn.execute(
             "INSERT INTO reminders "
             "(message, remind_at, lead_time, is_alarm, urgency, recurring, "
-            "created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            "created_at, notify_at_epoch) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
             (message, remind_at, lead_time, int(is_alarm), urgency,
-             recurring, now),
+             recurring, now, _notify_epoch(remind_at, lead_time)),
         )
-        self._conn.commit()
+        self._commit()
         logger.info(
             "Reminder added (#%d): '%s' at %s",
             cursor.lastrowid, message, remind_at,
         )
         return cursor.lastrowid  # type: ignore[return-value]
 
+    def add_reminders_bulk(self, rows: list[dict]) -> list[int]:
+        """Add several reminders in a single transaction.
+
+        Args:
+            rows: Dicts with the same keys as add_reminder()'s arguments;
+                  "message" and "remind_at" are required.
+
+        Returns:
+            The new reminder IDs, in the order of ``rows``.
+        """
+        if not rows:
+            return []
+        now = datetime.now().isoformat()
+        params = []
+        for r in rows:
+            lead_time = r.get("lead_time", 5)
+            params.append((
+                r["message"], r["remind_at"], lead_time,
+                int(r.get("is_alarm", False)), r.get("urgency", 2),
+                r.get("recurring"), now, _notify_epoch(r["remind_at"], lead_time),
+            ))
+        with self.batch():
+            self._conn.executemany(
+                "INSERT INTO reminders "
+                "(message, remind_at, lead_time, is_alarm, urgency, recurring, "
+                "created_at, notify_at_epoch) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                params,
+            )
+            # AUTOINCREMENT ids are consecutive within one transaction
+            last = self._conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        logger.info("Reminders added in bulk: %d", len(rows))
+        return list(range(last - len(rows) + 1, last + 1))
+
     def get_pending_reminders(
         self, now: datetime, window_minutes: int = 2,
     ) -> list[dict]:
@@ -667,6 +944,9 @@ class MemoryStore:
         A reminder is due when:
             remind_at - lead_time <= now + window_minutes
 
+        The comparison runs in SQL against the indexed notify_at_epoch
+        column, so only the due rows have their remind_at parsed.
+
         Args:
             now: Current datetime.
             window_minutes: Look-ahead window in minutes.
@@ -674,18 +954,16 @@ class MemoryStore:
         Returns:
             List of reminder dicts with parsed remind_at as datetime.
         """
-        now_str = now.isoformat()
+        cutoff = int((now + timedelta(minutes=window_minutes)).timestamp())
         rows = self._conn.execute(
             """
             SELECT id, message, remind_at, lead_time, is_alarm,
                    urgency, recurring
             FROM reminders
-            WHERE delivered = 0
-              AND datetime(remind_at, '-' || lead_time || ' minutes')
-                  <= datetime(?, '+' || ? || ' minutes')
+            WHERE delivered = 0 AND notify_at_epoch <= ?
             ORDER BY remind_at ASC
             """,
-            (now_str, window_minutes),
+            (cutoff,),
         ).fetchall()
 
         results = []
@@ -712,7 +990,7 @@ class MemoryStore:
             "UPDATE reminders SET delivered = 1, delivered_at = ? WHERE id = ?",
             (now, reminder_id),
         )
-        self._conn.commit()
+        self._commit()
 
     def cancel_reminder(self, reminder_id: int) -> bool:
         """Cancel (delete) a reminder by ID.
@@ -726,7 +1004,7 @@ class MemoryStore:
         cursor = self._conn.execute(
             "DELETE FROM reminders WHERE id = ?", (reminder_id,),
         )
-        self._conn.commit()
+        self._commit()
         if cursor.rowcount > 0:
             logger.info("Reminder #%d cancelled", reminder_id)
             return True
@@ -781,21 +1059,16 @@ class MemoryStore:
         if not recurring:
             return None
 
-        from datetime import timedelta
-
         remind_at = reminder["remind_at"]
         if isinstance(remind_at, str):
             remind_at = datetime.fromisoformat(remind_at)
 
         if recurring == "daily":
-            next_at = remind_at + timedelta(days=1)
+            next_at = remind_at + _DAILY
         elif recurring == "weekly":
-            next_at = remind_at + timedelta(days=7)
+            next_at = remind_at + _WEEKLY
         elif recurring == "weekdays":
-            next_at = remind_at + timedelta(days=1)
-            # Skip Saturday (5) and Sunday (6)
-            while next_at.weekday() in (5, 6):
-                next_at += timedelta(days=1)
+            next_at = remind_at + _WEEKDAY_DELTA[remind_at.weekday()]
         else:
             logger.warning("Unknown recurring type: %s", recurring)
             return None
@@ -812,7 +1085,8 @@ class MemoryStore:
     # --- Cleanup ---
 
     def close(self) -> None:
-        """Close the database connection."""
+        """Flush any pending MEMORY.md update and close the connection."""
+        self.flush_memory_md()
         self._conn.close()
 
 
@@ -825,6 +1099,7 @@ def get_memory_store() -> MemoryStore:
     global _instance
     if _instance is None:
         _instance = MemoryStore()
+        atexit.register(_instance.flush_memory_md)
     return _instance
 
 
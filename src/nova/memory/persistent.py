@@ -6,6 +6,7 @@ The old ~/.nova/memory.json is automatically migrated on first access.
 """
 
 import logging
+from functools import cache
 
 logger = logging.getLogger(__name__)
 
@@ -52,26 +53,21 @@ class UserMemory:
         return self._store.memory_count()
 
 
-# Module-level singleton
-_instance: "UserMemory | None" = None
-
-
+@cache
 def get_user_memory() -> UserMemory:
     """Get the singleton UserMemory instance.
 
+    Created on first call; later calls are a cache hit.
+
     Returns:
         The shared UserMemory (backed by SQLite).
     """
-    global _instance
-    if _instance is None:
-        _instance = UserMemory()
-    return _instance
+    return UserMemory()
 
 
 def reset_user_memory() -> None:
     """Reset the singleton (for testing)."""
-    global _instance
-    _instance = None
+    get_user_memory.cache_clear()
 
 
 # --- Tool functions called by the LLM via function calling ---
@@ -246,6 +246,14 @@ class PromptAssembler:
         """
         self._pending_notification_context = context
 
+    def reset(self) -> None:
+        """Discard any pending memory and notification context.
+
+        File caches are kept; only the one-shot context is cleared.
+        """
+        self._pending_memory_context = ""
+        self._pending_notification_context = ""
+
 
 def get_prompt_assembler() -> PromptAssembler:
     """Get the singleton PromptAssembler instance.
@@ -5,10 +5,13 @@ and cosine similarity on embeddings. Falls back to FTS5-only when the
 embedding API is unavailable.
 """
 
+import inspect
 import logging
 import math
 from datetime import datetime
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,7 +36,8 @@ class MemoryRetriever:
 
         Args:
             memory_store: The MemoryStore to search.
-            embedding_fn: Optional async fn(text) -> list[float].
+            embedding_fn: Optional fn(text) -> list[float] or ndarray,
+                          async or plain (e.g. a cached embedder).
                           If None, only FTS5 keyword search is used.
         """
         from nova.memory.memory_store import MemoryStore
@@ -67,7 +71,9 @@ class MemoryRetriever:
         # Vector search (if embedding function available)
         if self._embedding_fn:
             try:
-                query_vec = await self._embedding_fn(query)
+                query_vec = self._embedding_fn(query)
+                if inspect.isawaitable(query_vec):
+                    query_vec = await query_vec
                 for row in self._store.get_memories_with_embeddings():
                     sim = self._cosine_similarity(
                         query_vec, row["embedding"],
@@ -126,11 +132,14 @@ class MemoryRetriever:
         return "\n".join(lines)
 
     @staticmethod
-    def _cosine_similarity(a: list[float], b: list[float]) -> float:
+    def _cosine_similarity(
+        a: "list[float] | np.ndarray", b: "list[float] | np.ndarray",
+    ) -> float:
         """Compute cosine similarity between two vectors."""
-        dot = sum(x * y for x, y in zip(a, b))
-        na = math.sqrt(sum(x * x for x in a))
-        nb = math.sqrt(sum(x * x for x in b))
+        a = np.asarray(a, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        na = np.linalg.norm(a)
+        nb = np.linalg.norm(b)
         if na == 0 or nb == 0:
             return 0.0
-        return dot / (na * nb)
+        return float(np.dot(a, b) / (na * nb))
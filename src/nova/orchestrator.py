@@ -44,6 +44,18 @@ _GREETINGS = {
     "assalamualaikum", "apa kabar", "how are you",
 }
 
+# Scheduler rule tokens → instruction injected into the LLM context
+_TOKEN_TEMPLATES = {
+    "__morning_greeting__": "Deliver a brief morning greeting to the user.",
+    "__sleep_reminder__": "Gently remind the user it's late and they should rest.",
+}
+
+# Scheduler rule tokens → prompt for a spoken (proactive) delivery
+_TOKEN_PROMPTS = {
+    "__morning_greeting__": "Deliver a brief, warm morning greeting.",
+    "__sleep_reminder__": "Gently remind the user it's late and time to rest.",
+}
+
 
 class Orchestrator:
     """Coordinates the full NOVA pipeline: STT -> LLM -> TTS -> playback."""
@@ -237,17 +249,10 @@ class Orchestrator:
         Returns:
             Formatted string for the LLM to incorporate naturally.
         """
-        lines: list[str] = []
-        for n in notifications:
-            if n.message == "__morning_greeting__":
-                lines.append("Deliver a brief morning greeting to the user.")
-            elif n.message == "__sleep_reminder__":
-                lines.append(
-                    "Gently remind the user it's late and they should rest."
-                )
-            else:
-                lines.append(f"Remind the user: {n.message}")
-        return "\n".join(lines)
+        return "\n".join(
+            _TOKEN_TEMPLATES.get(n.message) or f"Remind the user: {n.message}"
+            for n in notifications
+        )
 
     async def _respond(
         self, user_input: str,
@@ -545,12 +550,9 @@ class Orchestrator:
         Returns:
             The generated notification text.
         """
-        if notification.message == "__morning_greeting__":
-            prompt = "Deliver a brief, warm morning greeting."
-        elif notification.message == "__sleep_reminder__":
-            prompt = "Gently remind the user it's late and time to rest."
-        else:
-            prompt = f"Deliver this reminder concisely: {notification.message}"
+        prompt = _TOKEN_PROMPTS.get(notification.message) or (
+            f"Deliver this reminder concisely: {notification.message}"
+        )
 
         # Use LLM to generate natural wording, then TTS
         try:
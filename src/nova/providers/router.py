@@ -22,6 +22,14 @@ class ProviderRouter:
     provider across successive calls.
     """
 
+    # Clock for backoff bookkeeping; overridable so tests can move time
+    _now = staticmethod(time.monotonic)
+
+    # Backoff schedule: 1s, 2s, 4s, 8s, 16s (capped), forgotten after
+    # _BACKOFF_RESET seconds without a failure
+    _BACKOFF_CAP = 16.0
+    _BACKOFF_RESET = 60.0
+
     def __init__(self, provider_type: str, providers: list) -> None:
         """Initialize the router.
 
@@ -33,8 +41,12 @@ class ProviderRouter:
             raise ValueError(f"At least one {provider_type} provider is required")
         self.provider_type = provider_type
         self.providers = providers
-        # Track backoff state per provider name: {name: (fail_count, last_fail_time)}
-        self._backoff: dict[str, tuple[int, float]] = {}
+        # Backoff state per provider name. _banned holds every provider with
+        # live failure state, so a healthy provider costs one set lookup;
+        # _backoff_until is the monotonic time before which it is skipped.
+        self._banned: set[str] = set()
+        self._backoff_until: dict[str, float] = {}
+        self._failures: dict[str, tuple[int, float]] = {}  # (count, last_fail_time)
 
     def _get_backoff_delay(self, provider_name: str) -> float:
         """Calculate current backoff delay for a provider.
@@ -43,29 +55,35 @@ class ProviderRouter:
         Backoff schedule: 1s, 2s, 4s, 8s, 16s (capped).
         Backoff resets after 60 seconds of no failures.
         """
-        if provider_name not in self._backoff:
+        if provider_name not in self._banned:
             return 0.0
-        fail_count, last_fail_time = self._backoff[provider_name]
-        elapsed = time.monotonic() - last_fail_time
+        now = self._now()
+        _, last_fail_time = self._failures[provider_name]
         # Reset backoff after 60s of no failures
-        if elapsed > 60.0:
-            del self._backoff[provider_name]
+        if now - last_fail_time > self._BACKOFF_RESET:
+            self._clear_backoff(provider_name)
             return 0.0
-        delay = min(2 ** (fail_count - 1), 16.0)
-        remaining = delay - elapsed
-        return max(remaining, 0.0)
+        return max(self._backoff_until[provider_name] - now, 0.0)
 
     def _record_failure(self, provider_name: str) -> None:
-        """Record a failure for backoff tracking."""
-        if provider_name in self._backoff:
-            fail_count, _ = self._backoff[provider_name]
-            self._backoff[provider_name] = (fail_count + 1, time.monotonic())
-        else:
-            self._backoff[provider_name] = (1, time.monotonic())
+        """Record a failure and push back the provider's backoff deadline."""
+        fail_count = self._failures.get(provider_name, (0, 0.0))[0] + 1
+        now = self._now()
+        self._failures[provider_name] = (fail_count, now)
+        self._backoff_until[provider_name] = now + min(
+            2 ** (fail_count - 1), self._BACKOFF_CAP,
+        )
+        self._banned.add(provider_name)
 
     def _record_success(self, provider_name: str) -> None:
         """Reset backoff on success."""
-        self._backoff.pop(provider_name, None)
+        self._clear_backoff(provider_name)
+
+    def _clear_backoff(self, provider_name: str) -> None:
+        """Forget all backoff state for a provider."""
+        self._banned.discard(provider_name)
+        self._backoff_until.pop(provider_name, None)
+        self._failures.pop(provider_name, None)
 
     async def execute(self, method_name: str, *args, **kwargs):
         """Execute a method on providers with failover.
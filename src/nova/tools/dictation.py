@@ -6,17 +6,45 @@ simulate keyboard input into whatever app is currently focused.
 
 import asyncio
 import logging
+from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
 
-async def dictate(text: str) -> str:
+# Seconds to wait before typing, to let the user focus the target window
+_FOCUS_DELAY = 0.5
+
+
+def _type_text(text: str) -> None:
+    """Type text into the focused window with pyautogui.
+
+    pyautogui.write() only handles ASCII; for Unicode, fall back to
+    copying to the clipboard and pasting.
+
+    Raises:
+        ImportError: If pyautogui is not installed.
+    """
+    import pyautogui
+
+    try:
+        pyautogui.write(text, interval=0.02)
+    except Exception:
+        import pyperclip
+
+        pyperclip.copy(text)
+        pyautogui.hotkey("ctrl", "v")
+
+
+async def dictate(
+    text: str, _typer: Callable[[str], None] = _type_text,
+) -> str:
     """Type the given text into the currently active window.
 
     Uses pyautogui.write() for ASCII and pyperclip+hotkey for Unicode text.
 
     Args:
         text: The text to type.
+        _typer: Function that does the typing (tests inject a recorder).
 
     Returns:
         Confirmation message.
@@ -25,21 +53,8 @@ async def dictate(text: str) -> str:
         return "Tidak ada teks untuk diketik."
 
     try:
-        import pyautogui
-
-        # Small delay to let user focus the target window
-        await asyncio.sleep(0.5)
-
-        # pyautogui.write() only handles ASCII; for Unicode, use clipboard
-        try:
-            pyautogui.write(text, interval=0.02)
-        except Exception:
-            # Fallback: copy to clipboard and paste
-            import pyperclip
-
-            pyperclip.copy(text)
-            pyautogui.hotkey("ctrl", "v")
-
+        await asyncio.sleep(_FOCUS_DELAY)
+        _typer(text)
         logger.info("Tool dictate → %d chars", len(text))
         return f"Teks berhasil diketik: {text[:50]}{'...' if len(text) > 50 else ''}"
     except ImportError:
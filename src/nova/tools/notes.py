@@ -4,6 +4,7 @@ All functions are async and return human-readable status strings.
 """
 
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -11,6 +12,26 @@ logger = logging.getLogger(__name__)
 
 _NOTES_DIR = Path.home() / ".nova"
 _NOTES_FILE = _NOTES_DIR / "notes.txt"
+_TAIL_BLOCK = 4096
+
+
+def _read_tail(path: Path, count: int) -> list[str]:
+    """Return the last ``count`` lines of a file, ignoring trailing blanks.
+
+    Reads backwards from the end in blocks, so the cost depends on the
+    size of the tail rather than the whole (append-only) notes file.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        while pos > 0 and data.rstrip().count(b"\n") <= count:
+            step = min(_TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    # A block boundary may split the first (discarded) line mid-character
+    lines = data.decode("utf-8", errors="replace").strip().splitlines()
+    return lines[-count:]
 
 
 async def add_note(text: str) -> str:
@@ -44,10 +65,9 @@ async def get_notes() -> str:
     try:
         if not _NOTES_FILE.exists():
             return "Belum ada catatan."
-        lines = _NOTES_FILE.read_text(encoding="utf-8").strip().splitlines()
-        if not lines:
+        last_10 = _read_tail(_NOTES_FILE, 10)
+        if not last_10:
             return "Belum ada catatan."
-        last_10 = lines[-10:]
         logger.info("Tool get_notes → %d notes", len(last_10))
         return "Catatan terakhir:\n" + "\n".join(last_10)
     except Exception as e:
@@ -62,8 +82,7 @@ async def clear_notes() -> str:
         Confirmation message.
     """
     try:
-        if _NOTES_FILE.exists():
-            _NOTES_FILE.write_text("", encoding="utf-8")
+        _NOTES_FILE.unlink(missing_ok=True)
         logger.info("Tool clear_notes executed")
         return "Semua catatan telah dihapus."
     except Exception as e:
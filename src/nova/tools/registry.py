@@ -4,31 +4,13 @@ Defines FunctionDeclaration schemas for Gemini and dispatches tool calls
 to the correct implementation.
 """
 
+import importlib
 import logging
+from collections.abc import Awaitable, Callable
+from functools import cache
 
 from google.genai import types
 
-from nova.memory.persistent import (
-    memory_forget,
-    memory_search,
-    memory_store,
-    recall_facts,
-    remember_fact,
-    update_user_profile,
-)
-from nova.tools import (
-    dictation,
-    display_control,
-    heartbeat_reminders,
-    music_player,
-    network_control,
-    notes,
-    system_control,
-    system_info,
-    time_date,
-    web_search,
-)
-
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -737,84 +719,95 @@ _FUNCTION_DECLARATIONS = [
     ),
 ]
 
-# Map function names → async callables
-_TOOL_IMPLEMENTATIONS: dict[str, object] = {
+# Map function names → module defining the async implementation (under
+# the same name). Modules are imported on first dispatch, so loading the
+# registry doesn't pull in psutil, ddgs or the memory store.
+_TOOL_MODULES: dict[str, str] = {
     # Time/Date
-    "get_current_time": time_date.get_current_time,
-    "get_current_date": time_date.get_current_date,
-    "get_current_datetime": time_date.get_current_datetime,
+    "get_current_time": "nova.tools.time_date",
+    "get_current_date": "nova.tools.time_date",
+    "get_current_datetime": "nova.tools.time_date",
     # Volume
-    "volume_up": system_control.volume_up,
-    "volume_down": system_control.volume_down,
-    "mute_unmute": system_control.mute_unmute,
+    "volume_up": "nova.tools.system_control",
+    "volume_down": "nova.tools.system_control",
+    "mute_unmute": "nova.tools.system_control",
     # Media
-    "play_pause_media": system_control.play_pause_media,
-    "next_track": system_control.next_track,
-    "previous_track": system_control.previous_track,
+    "play_pause_media": "nova.tools.system_control",
+    "next_track": "nova.tools.system_control",
+    "previous_track": "nova.tools.system_control",
     # Apps
-    "open_app": system_control.open_app,
-    "open_browser": system_control.open_browser,
-    "open_url": system_control.open_url,
-    "open_terminal": system_control.open_terminal,
-    "open_file_manager": system_control.open_file_manager,
+    "open_app": "nova.tools.system_control",
+    "open_browser": "nova.tools.system_control",
+    "open_url": "nova.tools.system_control",
+    "open_terminal": "nova.tools.system_control",
+    "open_file_manager": "nova.tools.system_control",
     # Power
-    "lock_screen": system_control.lock_screen,
-    "shutdown_pc": system_control.shutdown_pc,
-    "restart_pc": system_control.restart_pc,
-    "sleep_pc": system_control.sleep_pc,
+    "lock_screen": "nova.tools.system_control",
+    "shutdown_pc": "nova.tools.system_control",
+    "restart_pc": "nova.tools.system_control",
+    "sleep_pc": "nova.tools.system_control",
     # Screenshot & Timer
-    "take_screenshot": system_control.take_screenshot,
-    "set_timer": system_control.set_timer,
+    "take_screenshot": "nova.tools.system_control",
+    "set_timer": "nova.tools.system_control",
     # Web Search
-    "web_search": web_search.web_search,
+    "web_search": "nova.tools.web_search",
     # User Memory
-    "memory_store": memory_store,
-    "memory_search": memory_search,
-    "memory_forget": memory_forget,
-    "update_user_profile": update_user_profile,
+    "memory_store": "nova.memory.persistent",
+    "memory_search": "nova.memory.persistent",
+    "memory_forget": "nova.memory.persistent",
+    "update_user_profile": "nova.memory.persistent",
     # Legacy aliases
-    "remember_fact": remember_fact,
-    "recall_facts": recall_facts,
+    "remember_fact": "nova.memory.persistent",
+    "recall_facts": "nova.memory.persistent",
     # System Info
-    "get_battery_level": system_info.get_battery_level,
-    "get_ram_usage": system_info.get_ram_usage,
-    "get_storage_info": system_info.get_storage_info,
-    "get_ip_address": system_info.get_ip_address,
-    "get_system_uptime": system_info.get_system_uptime,
+    "get_battery_level": "nova.tools.system_info",
+    "get_ram_usage": "nova.tools.system_info",
+    "get_storage_info": "nova.tools.system_info",
+    "get_ip_address": "nova.tools.system_info",
+    "get_system_uptime": "nova.tools.system_info",
     # Quick Notes
-    "add_note": notes.add_note,
-    "get_notes": notes.get_notes,
-    "clear_notes": notes.clear_notes,
+    "add_note": "nova.tools.notes",
+    "get_notes": "nova.tools.notes",
+    "clear_notes": "nova.tools.notes",
     # Reminders (Heartbeat)
-    "set_reminder": heartbeat_reminders.set_reminder,
-    "list_reminders": heartbeat_reminders.list_reminders,
-    "cancel_reminder": heartbeat_reminders.cancel_reminder,
+    "set_reminder": "nova.tools.heartbeat_reminders",
+    "list_reminders": "nova.tools.heartbeat_reminders",
+    "cancel_reminder": "nova.tools.heartbeat_reminders",
     # Dictation
-    "dictate": dictation.dictate,
+    "dictate": "nova.tools.dictation",
     # Display / Brightness
-    "brightness_up": display_control.brightness_up,
-    "brightness_down": display_control.brightness_down,
-    "get_brightness": display_control.get_brightness,
+    "brightness_up": "nova.tools.display_control",
+    "brightness_down": "nova.tools.display_control",
+    "get_brightness": "nova.tools.display_control",
     # Network / Wi-Fi
-    "wifi_on": network_control.wifi_on,
-    "wifi_off": network_control.wifi_off,
-    "get_wifi_status": network_control.get_wifi_status,
+    "wifi_on": "nova.tools.network_control",
+    "wifi_off": "nova.tools.network_control",
+    "get_wifi_status": "nova.tools.network_control",
     # Music Playback
-    "play_music": music_player.play_music,
-    "pause_resume_music": music_player.pause_resume_music,
-    "skip_track": music_player.skip_track,
-    "previous_music_track": music_player.previous_music_track,
-    "stop_music": music_player.stop_music,
+    "play_music": "nova.tools.music_player",
+    "pause_resume_music": "nova.tools.music_player",
+    "skip_track": "nova.tools.music_player",
+    "previous_music_track": "nova.tools.music_player",
+    "stop_music": "nova.tools.music_player",
 }
 
 
-def get_tool_declarations() -> list[types.Tool]:
-    """Return the list of Tool objects for Gemini function calling.
+@cache
+def get_tool_declarations() -> tuple[types.Tool, ...]:
+    """Return the Tool objects for Gemini function calling.
+
+    Built once per process; every call returns the same tuple.
 
     Returns:
-        A list containing a single Tool with all function declarations.
+        A tuple containing a single Tool with all function declarations.
     """
-    return [types.Tool(function_declarations=_FUNCTION_DECLARATIONS)]
+    return (types.Tool(function_declarations=_FUNCTION_DECLARATIONS),)
+
+
+@cache
+def _load_tool(name: str) -> Callable[..., Awaitable[str]]:
+    """Import the module implementing a tool and return its callable."""
+    return getattr(importlib.import_module(_TOOL_MODULES[name]), name)
 
 
 async def execute_tool(name: str, args: dict | None = None) -> str:
@@ -830,9 +823,9 @@ async def execute_tool(name: str, args: dict | None = None) -> str:
     Raises:
         ValueError: If the tool name is unknown.
     """
-    impl = _TOOL_IMPLEMENTATIONS.get(name)
-    if impl is None:
+    if name not in _TOOL_MODULES:
         raise ValueError(f"Unknown tool: {name!r}")
+    impl = _load_tool(name)
 
     logger.info("Executing tool: %s(%s)", name, args or "")
     result = await impl(**(args or {}))
@@ -840,10 +833,18 @@ async def execute_tool(name: str, args: dict | None = None) -> str:
     return result
 
 
-def get_all_tool_names() -> list[str]:
+@cache
+def get_all_tool_names() -> tuple[str, ...]:
     """Return all registered tool function names.
 
     Returns:
-        Sorted list of tool name strings.
+        Sorted tuple of tool name strings, computed once per process.
     """
-    return sorted(_TOOL_IMPLEMENTATIONS.keys())
+    return tuple(sorted(_TOOL_MODULES))
+
+
+def _invalidate() -> None:
+    """Drop the cached declarations, names and resolved tool callables."""
+    get_tool_declarations.cache_clear()
+    get_all_tool_names.cache_clear()
+    _load_tool.cache_clear()
@@ -4,15 +4,64 @@ All functions are async and return human-readable status strings.
 """
 
 import asyncio
+import inspect
 import logging
 import socket
 import sys
+import time
+from collections.abc import Callable
 from datetime import datetime
+from typing import Any
 
 import psutil
 
 logger = logging.getLogger(__name__)
 
+# Seconds each reading stays fresh, so back-to-back questions ("ram?",
+# "storage?") in one conversation don't re-poll the OS
+_TTL = {
+    "battery": 5.0,
+    "ram": 1.0,
+    "storage": 10.0,
+    "boot_time": float("inf"),
+    "ip": 30.0,
+}
+# key -> (monotonic timestamp, value)
+_cache: dict[str, tuple[float, Any]] = {}
+
+
+_NO_PUBLIC_IP = "tidak tersedia"
+
+
+async def _cached(
+    key: str,
+    read: Callable[[], Any],
+    keep: Callable[[Any], bool] | None = None,
+) -> Any:
+    """Return a fresh cached reading for ``key``, calling ``read`` on a miss.
+
+    A cached None counts as a hit (no battery stays no battery).
+
+    Args:
+        key: Reading name; its TTL comes from _TTL.
+        read: Sync or async callable producing the reading.
+        keep: Optional predicate; readings it rejects are returned
+              but not cached.
+
+    Returns:
+        The cached or freshly read value.
+    """
+    now = time.monotonic()
+    hit = _cache.get(key)
+    if hit is not None and now - hit[0] < _TTL[key]:
+        return hit[1]
+    value = read()
+    if inspect.isawaitable(value):
+        value = await value
+    if keep is None or keep(value):
+        _cache[key] = (now, value)
+    return value
+
 
 async def get_battery_level() -> str:
     """Get battery percentage and charging status.
@@ -21,7 +70,7 @@ async def get_battery_level() -> str:
         Battery info string, e.g. "Baterai: 75%, sedang mengisi."
     """
     try:
-        battery = psutil.sensors_battery()
+        battery = await _cached("battery", psutil.sensors_battery)
         if battery is None:
             return "Tidak ada baterai terdeteksi (kemungkinan PC desktop)."
         pct = round(battery.percent)
@@ -43,7 +92,7 @@ async def get_ram_usage() -> str:
         RAM usage string, e.g. "RAM: 2.1 GB / 4.0 GB (53%)."
     """
     try:
-        mem = psutil.virtual_memory()
+        mem = await _cached("ram", psutil.virtual_memory)
         used_gb = mem.used / (1024 ** 3)
         total_gb = mem.total / (1024 ** 3)
         pct = mem.percent
@@ -62,7 +111,7 @@ async def get_storage_info() -> str:
     """
     try:
         path = "C:\\" if sys.platform == "win32" else "/"
-        disk = psutil.disk_usage(path)
+        disk = await _cached("storage", lambda: psutil.disk_usage(path))
         used_gb = disk.used / (1024 ** 3)
         total_gb = disk.total / (1024 ** 3)
         free_gb = disk.free / (1024 ** 3)
@@ -77,6 +126,35 @@ async def get_storage_info() -> str:
         return f"Gagal mendapatkan info storage: {e}"
 
 
+async def _lookup_ip() -> str:
+    """Look up local and public IP addresses (public via ifconfig.me)."""
+    # Local IP
+    local_ip = socket.gethostbyname(socket.gethostname())
+    if local_ip.startswith("127."):
+        # Fallback: connect to external to find local IP
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            s.connect(("8.8.8.8", 80))
+            local_ip = s.getsockname()[0]
+        finally:
+            s.close()
+
+    # Public IP via httpx (async)
+    import httpx
+
+    public_ip = _NO_PUBLIC_IP
+    try:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            resp = await client.get("https://ifconfig.me/ip")
+            if resp.status_code == 200:
+                public_ip = resp.text.strip()
+    except Exception:
+        logger.debug("Failed to fetch public IP", exc_info=True)
+
+    logger.info("Tool get_ip_address → local=%s, public=%s", local_ip, public_ip)
+    return f"IP lokal: {local_ip}, IP publik: {public_ip}."
+
+
 async def get_ip_address() -> str:
     """Get local and public IP addresses.
 
@@ -84,31 +162,10 @@ async def get_ip_address() -> str:
         IP address info string.
     """
     try:
-        # Local IP
-        local_ip = socket.gethostbyname(socket.gethostname())
-        if local_ip.startswith("127."):
-            # Fallback: connect to external to find local IP
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            try:
-                s.connect(("8.8.8.8", 80))
-                local_ip = s.getsockname()[0]
-            finally:
-                s.close()
-
-        # Public IP via httpx (async)
-        import httpx
-
-        public_ip = "tidak tersedia"
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.get("https://ifconfig.me/ip")
-                if resp.status_code == 200:
-                    public_ip = resp.text.strip()
-        except Exception:
-            logger.debug("Failed to fetch public IP", exc_info=True)
-
-        logger.info("Tool get_ip_address → local=%s, public=%s", local_ip, public_ip)
-        return f"IP lokal: {local_ip}, IP publik: {public_ip}."
+        # Only cache once the public lookup succeeded
+        return await _cached(
+            "ip", _lookup_ip, keep=lambda result: _NO_PUBLIC_IP not in result,
+        )
     except Exception as e:
         logger.error("Failed to get IP address: %s", e)
         return f"Gagal mendapatkan IP address: {e}"
@@ -121,7 +178,7 @@ async def get_system_uptime() -> str:
         Uptime string, e.g. "Sistem sudah menyala selama 3 jam 25 menit."
     """
     try:
-        boot_time = datetime.fromtimestamp(psutil.boot_time())
+        boot_time = datetime.fromtimestamp(await _cached("boot_time", psutil.boot_time))
         uptime = datetime.now() - boot_time
         total_seconds = int(uptime.total_seconds())
         hours = total_seconds // 3600
@@ -6,14 +6,31 @@ from datetime import datetime
 logger = logging.getLogger(__name__)
 
 
+# Locale-independent Indonesian names: Day, DD Month YYYY
+_MONTHS_ID = (
+    "", "Januari", "Februari", "Maret", "April", "Mei", "Juni",
+    "Juli", "Agustus", "September", "Oktober", "November", "Desember",
+)
+_DAYS_ID = ("Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu")
+
+
+def _format_time(now: datetime) -> str:
+    """Format a datetime as HH:MM."""
+    return f"{now.hour:02d}:{now.minute:02d}"
+
+
+def _format_date(now: datetime) -> str:
+    """Format a datetime as e.g. "Sabtu, 22 Februari 2026"."""
+    return f"{_DAYS_ID[now.weekday()]}, {now.day} {_MONTHS_ID[now.month]} {now.year}"
+
+
 async def get_current_time() -> str:
     """Get the current local time as a human-readable string.
 
     Returns:
         Formatted time string, e.g. "14:30" or "2:30 PM".
     """
-    now = datetime.now()
-    result = now.strftime("%H:%M")
+    result = _format_time(datetime.now())
     logger.info("Tool get_current_time → %s", result)
     return result
 
@@ -24,18 +41,7 @@ async def get_current_date() -> str:
     Returns:
         Formatted date string, e.g. "Sabtu, 22 Februari 2026".
     """
-    now = datetime.now()
-    # Use locale-independent format: Day, DD Month YYYY
-    months_id = [
-        "", "Januari", "Februari", "Maret", "April", "Mei", "Juni",
-        "Juli", "Agustus", "September", "Oktober", "November", "Desember",
-    ]
-    days_id = [
-        "Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu",
-    ]
-    day_name = days_id[now.weekday()]
-    month_name = months_id[now.month]
-    result = f"{day_name}, {now.day} {month_name} {now.year}"
+    result = _format_date(datetime.now())
     logger.info("Tool get_current_date → %s", result)
     return result
 
@@ -43,12 +49,14 @@ async def get_current_date() -> str:
 async def get_current_datetime() -> str:
     """Get the current local date and time as a human-readable string.
 
+    Both parts come from a single clock read, so they can't straddle
+    midnight.
+
     Returns:
         Formatted datetime string combining date and time.
     """
-    date_str = await get_current_date()
-    time_str = await get_current_time()
-    result = f"{date_str}, pukul {time_str}"
+    now = datetime.now()
+    result = f"{_format_date(now)}, pukul {_format_time(now)}"
     logger.info("Tool get_current_datetime → %s", result)
     return result
 
@@ -0,0 +1,76 @@
+"""Shared pytest configuration for the NOVA test suite."""
+
+import re
+import sys
+
+import pytest
+
+from nova.memory.memory_store import MemoryStore
+
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    if uvloop is not None:
+
+        def pytest_asyncio_loop_factories(config, item):
+            """Run async tests on uvloop's libuv-based event loop."""
+            return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def memory_store_template():
+    """An empty in-memory MemoryStore with the schema built once per session."""
+    template = MemoryStore(db_path=":memory:", durability="off")
+    yield template
+    template.close()
+
+
+@pytest.fixture
+def store(memory_store_template):
+    """A fresh in-memory MemoryStore cloned from the session template."""
+    s = memory_store_template.clone_in_memory()
+    yield s
+    s.close()
+
+
+@pytest.fixture(scope="session")
+def populated_store_template(memory_store_template):
+    """The session template plus ten "item" memories and a hobby, inserted once."""
+    template = memory_store_template.clone_in_memory()
+    template.bulk_store_memories(
+        [(f"item{i}", f"value item {i}") for i in range(10)]
+        + [("hobby", "programming")],
+    )
+    yield template
+    template.close()
+
+
+@pytest.fixture
+def populated_store(populated_store_template):
+    """A fresh in-memory copy of the populated session template."""
+    s = populated_store_template.clone_in_memory()
+    yield s
+    s.close()
+
+
+@pytest.fixture(scope="session")
+def store_dir(tmp_path_factory):
+    """One directory for every file-backed test database in the session."""
+    return tmp_path_factory.mktemp("stores")
+
+
+@pytest.fixture
+def file_store(store_dir, request):
+    """A MemoryStore on disk, as a per-test file in the shared store_dir.
+
+    For tests that need a real database file; MEMORY.md syncing and
+    fsyncs are off, and the file is removed afterwards.
+    """
+    db = store_dir / (re.sub(r"\W", "_", request.node.name) + ".db")
+    s = MemoryStore(db_path=db, sync_memory_md=False, durability="off")
+    yield s
+    s.close()
+    db.unlink(missing_ok=True)
@@ -3,16 +3,12 @@
 import pytest
 
 from nova.memory.conversation import ConversationManager
-from nova.memory.memory_store import MemoryStore
 
 
 @pytest.fixture
-def store(tmp_path):
-    """Create a MemoryStore with a temporary database."""
-    db = tmp_path / "test.db"
-    s = MemoryStore(db_path=db)
-    yield s
-    s.close()
+def store(file_store):
+    """A MemoryStore backed by a database file."""
+    return file_store
 
 
 @pytest.fixture
@@ -26,14 +22,12 @@ class TestBasicOperations:
         assert manager.get_context() == []
         assert manager.turn_count == 0
 
-    @pytest.mark.asyncio
     async def test_add_turn(self, manager):
         await manager.add_turn("user", "Hello")
         assert manager.turn_count == 1
         ctx = manager.get_context()
         assert ctx[0] == {"role": "user", "content": "Hello"}
 
-    @pytest.mark.asyncio
     async def test_add_exchange(self, manager):
         await manager.add_exchange("how are you", "I am well")
         assert manager.turn_count == 2
@@ -41,7 +35,6 @@ class TestBasicOperations:
         assert ctx[0]["role"] == "user"
         assert ctx[1]["role"] == "assistant"
 
-    @pytest.mark.asyncio
     async def test_multiple_exchanges(self, manager):
         for i in range(5):
             await manager.add_exchange(f"msg{i}", f"resp{i}")
@@ -55,7 +48,6 @@ class TestBasicOperations:
 
 
 class TestPersistence:
-    @pytest.mark.asyncio
     async def test_interactions_persisted_to_db(self, store, manager):
         await manager.add_exchange("hello", "world")
         recent = store.get_recent_interactions()
@@ -63,7 +55,6 @@ class TestPersistence:
         assert recent[0]["role"] == "user"
         assert recent[1]["role"] == "assistant"
 
-    @pytest.mark.asyncio
     async def test_restart_recovery(self, store):
         # Simulate first session
         mgr1 = ConversationManager(memory_store=store, llm_fn=None)
@@ -77,7 +68,6 @@ class TestPersistence:
 
 
 class TestCompaction:
-    @pytest.mark.asyncio
     async def test_compaction_triggers_at_max_turns(self, store):
         manager = ConversationManager(
             memory_store=store, llm_fn=None,
@@ -89,7 +79,6 @@ class TestCompaction:
         # After compaction: should have fewer than MAX_TURNS*2
         assert manager.turn_count < 40
 
-    @pytest.mark.asyncio
     async def test_compaction_with_llm_fn(self, store):
         async def mock_llm(prompt: str) -> str:
             if "Summarize" in prompt:
@@ -113,7 +102,21 @@ class TestCompaction:
         assert store.get_memory("hobby") == "testing"
         assert store.get_memory("food") == "nasi goreng"
 
-    @pytest.mark.asyncio
+    async def test_context_prefix_is_stable(self, store):
+        manager = ConversationManager(
+            memory_store=store, llm_fn=None,
+        )
+        for i in range(20):
+            await manager.add_exchange(f"msg {i}", f"resp {i}")
+
+        prefix = manager.get_context()[0]
+        assert "Ringkasan" in prefix["content"]
+        assert prefix["role"] == "user"
+
+        for i in range(3):
+            await manager.add_exchange(f"more {i}", f"reply {i}")
+            assert manager.get_context()[0] == prefix
+
     async def test_compaction_writes_daily_log(self, store, tmp_path):
         manager = ConversationManager(
             memory_store=store, llm_fn=None,
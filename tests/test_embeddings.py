@@ -2,30 +2,58 @@
 
 import asyncio
 import time
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from nova.memory.memory_store import MemoryStore
 from nova.memory.retriever import MemoryRetriever
 
 # --- Fixtures ---
 
 
 @pytest.fixture
-def store(tmp_path):
-    """Create a MemoryStore with a temporary database."""
-    db = tmp_path / "test.db"
-    s = MemoryStore(db_path=db)
-    yield s
-    s.close()
+def store(file_store):
+    """A MemoryStore backed by a database file."""
+    return file_store
+
+
+# --- Fake embedding client ---
+
+
+def _embed_result(values: list[float]) -> SimpleNamespace:
+    """Build an object shaped like an embed_content response."""
+    return SimpleNamespace(embeddings=[SimpleNamespace(values=values)])
+
+
+class FakeEmbedClient:
+    """A fake genai client replaying a preset list of embed behaviors.
+
+    Each call to ``models.embed_content`` consumes the next behavior;
+    the last one repeats once the list is exhausted. Exceptions are
+    raised, anything else is returned as the response.
+    """
+
+    def __init__(self, behaviors: list) -> None:
+        self.behaviors = behaviors
+        self.calls = 0
+
+    @property
+    def models(self) -> "FakeEmbedClient":
+        return self
+
+    def embed_content(self, **kwargs):
+        behavior = self.behaviors[min(self.calls, len(self.behaviors) - 1)]
+        self.calls += 1
+        if isinstance(behavior, Exception):
+            raise behavior
+        return behavior
 
 
 # --- GeminiEmbedder circuit breaker tests ---
 
 
 class TestGeminiEmbedderCircuitBreaker:
-    @pytest.mark.asyncio
     async def test_circuit_breaker_opens_after_threshold(self):
         """After 3 consecutive failures, embed returns None without API call."""
         from nova.memory.embeddings import GeminiEmbedder, reset_embedder
@@ -42,22 +70,21 @@ class TestGeminiEmbedderCircuitBreaker:
             )
 
             embedder = GeminiEmbedder()
-            # Mock the client to raise errors
-            embedder._client = MagicMock()
-            embedder._client.models.embed_content.side_effect = RuntimeError(
-                "API error",
-            )
+            # Fake client that always raises
+            embedder._client = FakeEmbedClient([RuntimeError("API error")])
 
             # First 3 calls should attempt API and fail
             for _i in range(3):
                 result = await embedder.embed("test")
                 assert result is None
+            assert embedder._client.calls == 3
 
             # After threshold, should return None immediately (disabled)
             assert embedder._consecutive_failures >= 3
             assert embedder._disabled_until > 0
+            assert await embedder.embed("test") is None
+            assert embedder._client.calls == 3
 
-    @pytest.mark.asyncio
     async def test_circuit_breaker_resets_on_success(self):
         """Successful embed resets the failure counter."""
         from nova.memory.embeddings import GeminiEmbedder, reset_embedder
@@ -75,17 +102,13 @@ class TestGeminiEmbedderCircuitBreaker:
 
             embedder = GeminiEmbedder()
 
-            # Mock successful response
-            mock_result = MagicMock()
-            mock_result.embeddings = [MagicMock(values=[0.1, 0.2, 0.3])]
-            embedder._client = MagicMock()
-            embedder._client.models.embed_content.return_value = mock_result
+            # Fake successful response
+            embedder._client = FakeEmbedClient([_embed_result([0.1, 0.2, 0.3])])
 
             result = await embedder.embed("test")
             assert result == [0.1, 0.2, 0.3]
             assert embedder._consecutive_failures == 0
 
-    @pytest.mark.asyncio
     async def test_circuit_breaker_retries_after_cooldown(self):
         """After cooldown period expires, the embedder retries."""
         from nova.memory.embeddings import GeminiEmbedder, reset_embedder
@@ -102,9 +125,9 @@ class TestGeminiEmbedderCircuitBreaker:
             )
 
             embedder = GeminiEmbedder()
-            embedder._client = MagicMock()
-            embedder._client.models.embed_content.side_effect = RuntimeError(
-                "API error",
+            # Three failures, then a success once the breaker retries
+            embedder._client = FakeEmbedClient(
+                [RuntimeError("API error")] * 3 + [_embed_result([1.0, 2.0])],
             )
 
             # Trigger circuit breaker
@@ -114,12 +137,6 @@ class TestGeminiEmbedderCircuitBreaker:
             # Simulate cooldown expiry
             embedder._disabled_until = time.monotonic() - 1
 
-            # Now provide a success response
-            mock_result = MagicMock()
-            mock_result.embeddings = [MagicMock(values=[1.0, 2.0])]
-            embedder._client.models.embed_content.side_effect = None
-            embedder._client.models.embed_content.return_value = mock_result
-
             result = await embedder.embed("test")
             assert result == [1.0, 2.0]
             assert embedder._consecutive_failures == 0
@@ -129,7 +146,6 @@ class TestGeminiEmbedderCircuitBreaker:
 
 
 class TestStoreMemoryWithEmbedding:
-    @pytest.mark.asyncio
     async def test_store_memory_auto_embeds(self, store):
         """When embedding_fn is set, store_memory schedules embedding."""
         mock_embed = AsyncMock(return_value=[0.1, 0.2, 0.3])
@@ -146,14 +162,12 @@ class TestStoreMemoryWithEmbedding:
         assert len(results[0]["embedding"]) == 3
         mock_embed.assert_called_once_with("blue")
 
-    @pytest.mark.asyncio
     async def test_store_memory_no_embed_when_fn_none(self, store):
         """Without embedding_fn, no embedding is stored."""
         store.store_memory("test", "value")
         results = store.get_memories_with_embeddings()
         assert len(results) == 0
 
-    @pytest.mark.asyncio
     async def test_store_memory_embed_failure_graceful(self, store):
         """Embedding failure doesn't break store_memory."""
         mock_embed = AsyncMock(side_effect=RuntimeError("API down"))
@@ -169,7 +183,6 @@ class TestStoreMemoryWithEmbedding:
 
 
 class TestBackfillEmbeddings:
-    @pytest.mark.asyncio
     async def test_backfill_embeds_null_embeddings(self, store):
         """backfill_embeddings embeds memories without embeddings."""
         store.store_memory("a", "apple")
@@ -183,7 +196,6 @@ class TestBackfillEmbeddings:
         results = store.get_memories_with_embeddings()
         assert len(results) == 2
 
-    @pytest.mark.asyncio
     async def test_backfill_skips_already_embedded(self, store):
         """backfill_embeddings skips memories that already have embeddings."""
         store.store_memory("a", "apple")
@@ -196,14 +208,12 @@ class TestBackfillEmbeddings:
         assert count == 1  # Only "b" was backfilled
         mock_embed.assert_called_once_with("banana")
 
-    @pytest.mark.asyncio
     async def test_backfill_returns_zero_no_fn(self, store):
         """backfill_embeddings returns 0 when no fn is available."""
         store.store_memory("a", "apple")
         count = await store.backfill_embeddings()
         assert count == 0
 
-    @pytest.mark.asyncio
     async def test_backfill_partial_failure(self, store):
         """backfill_embeddings continues on individual failures."""
         store.store_memory("a", "apple")
@@ -226,7 +236,6 @@ class TestBackfillEmbeddings:
 
 
 class TestRetrieverWithEmbedding:
-    @pytest.mark.asyncio
     async def test_retriever_uses_embedding_fn(self, store):
         """Retriever uses embedding_fn for vector search."""
         store.store_memory("pet", "cat named Milo")
@@ -242,7 +251,6 @@ class TestRetrieverWithEmbedding:
         assert results[0]["vector_score"] > 0.0
         mock_embed.assert_called_once_with("cat")
 
-    @pytest.mark.asyncio
     async def test_retriever_falls_back_without_embedder(self, store):
         """Retriever works with FTS5 only when no embedder."""
         store.store_memory("pet", "cat named Milo")
@@ -8,7 +8,7 @@ Mocks the Gemini streaming API to verify:
 """
 
 import sys
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
@@ -87,6 +87,36 @@ def gemini_provider():
     return provider
 
 
+@pytest.fixture()
+def stream_sequencer(gemini_provider, monkeypatch):
+    """Script the chunks returned by successive generate_content_stream calls.
+
+    Returns a setup function taking one list of chunks per expected
+    stream round (the first request, then one per tool call).
+    """
+    monkeypatch.setattr(
+        "nova.providers.llm.gemini._build_system_prompt", lambda: "sys",
+    )
+
+    def _setup(sequences: list[list]) -> None:
+        rounds = iter(sequences)
+
+        async def mock_stream():
+            for c in next(rounds):
+                yield c
+
+        gemini_provider._client.aio.models.generate_content_stream = AsyncMock(
+            side_effect=lambda *a, **kw: mock_stream(),
+        )
+
+    return _setup
+
+
+async def _collect(gen) -> list[str]:
+    """Drain an async sentence generator into a list."""
+    return [s async for s in gen]
+
+
 @pytest.fixture()
 def mock_registry():
     """Mock the nova.tools.registry module to avoid importing psutil etc.
@@ -139,254 +169,97 @@ class TestExtractSentence:
 class TestGenerateStreamPureText:
     """Test generate_stream() with text-only responses (no tool calls)."""
 
-    @pytest.mark.asyncio
-    async def test_yields_complete_sentences(self, gemini_provider):
-        """Streaming text chunks should be buffered and yielded as sentences."""
-        chunks = [
-            _make_text_chunk("Halo, saya Nova. "),
-            _make_text_chunk("Saya bisa membantu Anda."),
-        ]
-
-        async def mock_stream(*args, **kwargs):
-            for c in chunks:
-                yield c
+    @pytest.mark.parametrize(
+        ("chunks", "tools", "expected"),
+        [
+            pytest.param(
+                ["Halo, saya Nova. ", "Saya bisa membantu Anda."],
+                None,
+                ["Halo, saya Nova.", "Saya bisa membantu Anda."],
+                id="yields_complete_sentences",
+            ),
+            pytest.param(
+                ["No period here"],
+                None,
+                ["No period here"],
+                id="remaining_buffer_yielded",
+            ),
+            pytest.param(
+                ["Ini adalah respons tanpa tools."],
+                None,
+                ["Ini adalah respons tanpa tools."],
+                id="no_tools_still_streams",
+            ),
+        ],
+    )
+    async def test_streams_sentences(
+        self, gemini_provider, stream_sequencer, chunks, tools, expected,
+    ):
+        """Text chunks are buffered and yielded as complete sentences,
+        with any trailing text flushed at the end of the stream."""
+        stream_sequencer([[_make_text_chunk(c) for c in chunks]])
 
-        gemini_provider._client.aio.models.generate_content_stream = AsyncMock(
-            return_value=mock_stream(),
+        sentences = await _collect(
+            gemini_provider.generate_stream("test", context=[], tools=tools),
         )
 
-        with patch("nova.providers.llm.gemini._build_system_prompt", return_value="sys"):
-            sentences = []
-            async for s in gemini_provider.generate_stream("test", context=[]):
-                sentences.append(s)
-
-        # Should yield at least the content (possibly merged into one or two pieces)
-        full = " ".join(sentences)
-        assert "Halo" in full
-        assert "Nova" in full
-        assert "membantu" in full
-
-    @pytest.mark.asyncio
-    async def test_remaining_buffer_yielded(self, gemini_provider):
-        """Text without sentence boundary should be yielded at end of stream."""
-        chunks = [_make_text_chunk("No period here")]
-
-        async def mock_stream(*args, **kwargs):
-            for c in chunks:
-                yield c
-
-        gemini_provider._client.aio.models.generate_content_stream = AsyncMock(
-            return_value=mock_stream(),
-        )
-
-        with patch("nova.providers.llm.gemini._build_system_prompt", return_value="sys"):
-            sentences = []
-            async for s in gemini_provider.generate_stream("test", context=[]):
-                sentences.append(s)
-
-        assert len(sentences) == 1
-        assert sentences[0] == "No period here"
+        assert sentences == expected
 
 
 class TestGenerateStreamWithToolCall:
     """Test generate_stream() handling function calls mid-stream."""
 
-    @pytest.mark.asyncio
-    async def test_tool_call_executes_and_resumes(
-        self, gemini_provider, mock_registry,
+    @pytest.mark.parametrize(
+        ("tool_names", "tool_results", "final_text"),
+        [
+            pytest.param(
+                ["get_current_time"],
+                ["10:00"],
+                "Sekarang pukul 10:00 WIB.",
+                id="executes_and_resumes",
+            ),
+            pytest.param(
+                ["get_current_time", "get_current_date"],
+                ["10:00", "Sabtu, 1 Maret 2026"],
+                "Sekarang hari Sabtu, pukul 10:00 WIB.",
+                id="multiple_sequential_calls",
+            ),
+            pytest.param(
+                ["slow_tool"],
+                [TimeoutError("Tool timed out")],
+                "Maaf, tool sedang tidak tersedia.",
+                id="tool_timeout_handled",
+            ),
+            pytest.param(
+                ["broken_tool"],
+                [RuntimeError("Connection failed")],
+                "Terjadi kesalahan saat menjalankan tool.",
+                id="tool_error_handled",
+            ),
+        ],
+    )
+    async def test_tool_calls_execute_and_resume(
+        self, gemini_provider, stream_sequencer, mock_registry, monkeypatch,
+        tool_names, tool_results, final_text,
     ):
-        """When model emits function_call, tool should execute and new stream should start."""
-        # First stream: model emits a function call
-        first_chunks = [_make_function_call_chunk("get_current_time")]
-        # Second stream: model responds with text after tool result
-        second_chunks = [_make_text_chunk("Sekarang pukul 10:00 WIB.")]
-
-        call_count = 0
-
-        async def mock_stream(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                for c in first_chunks:
-                    yield c
-            else:
-                for c in second_chunks:
-                    yield c
-
-        gemini_provider._client.aio.models.generate_content_stream = AsyncMock(
-            side_effect=lambda *a, **kw: mock_stream(),
+        """Each function_call runs the tool (errors are reported back to
+        the model, not raised) and a new stream resumes with its result."""
+        stream_sequencer(
+            [[_make_function_call_chunk(name)] for name in tool_names]
+            + [[_make_text_chunk(final_text)]],
         )
-
-        mock_registry.execute_tool = AsyncMock(return_value="10:00")
-
-        with (
-            patch("nova.providers.llm.gemini._build_system_prompt", return_value="sys"),
-            patch.object(gemini_provider, "_get_config", return_value=MagicMock()),
-        ):
-            sentences = []
-            async for s in gemini_provider.generate_stream(
-                "jam berapa?", context=[], tools=["mock_tool"],
-            ):
-                sentences.append(s)
-
-        # Tool should have been called
-        mock_registry.execute_tool.assert_called_once_with("get_current_time", {})
-        # Should yield the text from the second stream
-        full = " ".join(sentences)
-        assert "10:00" in full
-
-    @pytest.mark.asyncio
-    async def test_multiple_sequential_tool_calls(
-        self, gemini_provider, mock_registry,
-    ):
-        """Model can make multiple tool calls in sequence."""
-        # Stream 1: first tool call
-        stream1 = [_make_function_call_chunk("get_current_time")]
-        # Stream 2: second tool call
-        stream2 = [_make_function_call_chunk("get_current_date")]
-        # Stream 3: final text response
-        stream3 = [_make_text_chunk("Sekarang hari Sabtu, pukul 10:00 WIB.")]
-
-        call_count = 0
-
-        async def mock_stream(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            streams = {1: stream1, 2: stream2, 3: stream3}
-            for c in streams.get(call_count, stream3):
-                yield c
-
-        gemini_provider._client.aio.models.generate_content_stream = AsyncMock(
-            side_effect=lambda *a, **kw: mock_stream(),
-        )
-
-        mock_registry.execute_tool = AsyncMock(
-            side_effect=["10:00", "Sabtu, 1 Maret 2026"],
-        )
-
-        with (
-            patch("nova.providers.llm.gemini._build_system_prompt", return_value="sys"),
-            patch.object(gemini_provider, "_get_config", return_value=MagicMock()),
-        ):
-            sentences = []
-            async for s in gemini_provider.generate_stream(
-                "jam dan tanggal?", context=[], tools=["mock_tool"],
-            ):
-                sentences.append(s)
-
-        assert mock_registry.execute_tool.call_count == 2
-        full = " ".join(sentences)
-        assert "Sabtu" in full or "10:00" in full
-
-    @pytest.mark.asyncio
-    async def test_tool_timeout_handled(
-        self, gemini_provider, mock_registry,
-    ):
-        """Tool that times out should send error to model, not crash."""
-        # Stream 1: tool call
-        stream1 = [_make_function_call_chunk("slow_tool")]
-        # Stream 2: model responds after getting timeout error
-        stream2 = [_make_text_chunk("Maaf, tool sedang tidak tersedia.")]
-
-        call_count = 0
-
-        async def mock_stream(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                for c in stream1:
-                    yield c
-            else:
-                for c in stream2:
-                    yield c
-
-        gemini_provider._client.aio.models.generate_content_stream = AsyncMock(
-            side_effect=lambda *a, **kw: mock_stream(),
-        )
-
-        mock_registry.execute_tool = AsyncMock(
-            side_effect=TimeoutError("Tool timed out"),
-        )
-
-        with (
-            patch("nova.providers.llm.gemini._build_system_prompt", return_value="sys"),
-            patch.object(gemini_provider, "_get_config", return_value=MagicMock()),
-        ):
-            sentences = []
-            async for s in gemini_provider.generate_stream(
-                "test", context=[], tools=["mock_tool"],
-            ):
-                sentences.append(s)
-
-        full = " ".join(sentences)
-        assert "tidak tersedia" in full or len(full) > 0
-
-    @pytest.mark.asyncio
-    async def test_tool_error_handled(
-        self, gemini_provider, mock_registry,
-    ):
-        """Tool that raises an exception should send error to model."""
-        # Stream 1: tool call
-        stream1 = [_make_function_call_chunk("broken_tool")]
-        # Stream 2: model responds after error
-        stream2 = [_make_text_chunk("Terjadi kesalahan saat menjalankan tool.")]
-
-        call_count = 0
-
-        async def mock_stream(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                for c in stream1:
-                    yield c
-            else:
-                for c in stream2:
-                    yield c
-
-        gemini_provider._client.aio.models.generate_content_stream = AsyncMock(
-            side_effect=lambda *a, **kw: mock_stream(),
+        mock_registry.execute_tool = AsyncMock(side_effect=tool_results)
+        monkeypatch.setattr(
+            gemini_provider, "_get_config", lambda tools=None: MagicMock(),
         )
 
-        mock_registry.execute_tool = AsyncMock(
-            side_effect=RuntimeError("Connection failed"),
-        )
-
-        with (
-            patch("nova.providers.llm.gemini._build_system_prompt", return_value="sys"),
-            patch.object(gemini_provider, "_get_config", return_value=MagicMock()),
-        ):
-            sentences = []
-            async for s in gemini_provider.generate_stream(
+        sentences = await _collect(
+            gemini_provider.generate_stream(
                 "test", context=[], tools=["mock_tool"],
-            ):
-                sentences.append(s)
-
-        full = " ".join(sentences)
-        assert len(full) > 0  # Model should still produce a response
-
-
-class TestGenerateStreamNoTools:
-    """Test that generate_stream works correctly when tools=None."""
-
-    @pytest.mark.asyncio
-    async def test_no_tools_still_streams(self, gemini_provider):
-        """Without tools, generate_stream should work as pure text streaming."""
-        chunks = [_make_text_chunk("Ini adalah respons tanpa tools.")]
-
-        async def mock_stream(*args, **kwargs):
-            for c in chunks:
-                yield c
-
-        gemini_provider._client.aio.models.generate_content_stream = AsyncMock(
-            return_value=mock_stream(),
+            ),
         )
 
-        with patch("nova.providers.llm.gemini._build_system_prompt", return_value="sys"):
-            sentences = []
-            async for s in gemini_provider.generate_stream(
-                "test", context=[], tools=None,
-            ):
-                sentences.append(s)
-
-        full = " ".join(sentences)
-        assert "tanpa tools" in full
+        assert mock_registry.execute_tool.await_args_list == [
+            call(name, {}) for name in tool_names
+        ]
+        assert sentences == [final_text]
@@ -36,6 +36,12 @@ class TestGenerateChime:
         expected = int(44100 * 0.6)
         assert len(audio) == expected
 
+    def test_repeat_calls_identical(self):
+        """Cached sine/envelope tables must not be mutated between calls."""
+        first = generate_chime(volume=0.9)
+        generate_chime(volume=0.1)
+        assert np.array_equal(generate_chime(volume=0.9), first)
+
 
 class TestGenerateAlert:
     def test_returns_int16_array(self):
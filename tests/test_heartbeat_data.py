@@ -1,5 +1,6 @@
 """Tests for heartbeat data layer — reminders CRUD + notification queue."""
 
+import sqlite3
 import threading
 from datetime import datetime, timedelta
 
@@ -9,15 +10,30 @@ from nova.heartbeat.queue import Notification, NotificationQueue, Urgency
 from nova.memory.memory_store import MemoryStore
 
 
-@pytest.fixture
-def store(tmp_path):
-    """Create a MemoryStore with a temporary database."""
-    db = tmp_path / "test_heartbeat.db"
-    s = MemoryStore(db_path=db)
+@pytest.fixture(scope="module")
+def store():
+    """One in-memory MemoryStore shared by every test in this module."""
+    s = MemoryStore(db_path=":memory:")
     yield s
     s.close()
 
 
+@pytest.fixture(autouse=True)
+def _truncate(request):
+    """Empty the shared store's reminders (and id sequence) after each test.
+
+    MemoryStore commits after every write, which would release a
+    SAVEPOINT, so isolation comes from deleting the rows instead of
+    rolling back. Tests that never touch the store skip the cleanup.
+    """
+    yield
+    if "store" in request.fixturenames:
+        request.getfixturevalue("store")._conn.executescript(
+            "DELETE FROM reminders;"
+            "DELETE FROM sqlite_sequence WHERE name = 'reminders';"
+        )
+
+
 # ── Reminder CRUD ────────────────────────────────────────────────────
 
 
@@ -62,13 +78,66 @@ class TestGetPendingReminders:
 
     def test_future_reminder_not_pending(self, store):
         # Reminder far in the future → not due
-        future = datetime.now() + timedelta(hours=24)
+        now = datetime.now()
+        future = now + timedelta(hours=24)
         store.add_reminder("Future", future.isoformat(), lead_time=5)
 
-        pending = store.get_pending_reminders(datetime.now(), window_minutes=2)
+        pending = store.get_pending_reminders(now, window_minutes=2)
         assert len(pending) == 0
 
 
+    @staticmethod
+    def _legacy_db(path, remind_ats):
+        """Create a pre-notify_at_epoch reminders table with the given rows."""
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE reminders (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "message TEXT NOT NULL, remind_at TEXT NOT NULL, "
+            "lead_time INTEGER DEFAULT 5, is_alarm BOOLEAN DEFAULT 0, "
+            "urgency INTEGER DEFAULT 2, recurring TEXT, "
+            "delivered BOOLEAN DEFAULT 0, created_at TEXT NOT NULL, "
+            "delivered_at TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO reminders (message, remind_at, created_at) "
+            "VALUES (?, ?, ?)",
+            [(message, remind_at, datetime.now().isoformat())
+             for message, remind_at in remind_ats],
+        )
+        conn.commit()
+        conn.close()
+
+    def test_legacy_db_backfilled(self, tmp_path):
+        """Databases created before notify_at_epoch get it backfilled."""
+        db = tmp_path / "legacy.db"
+        now = datetime.now()
+        self._legacy_db(db, [("Old", (now + timedelta(minutes=3)).isoformat())])
+
+        legacy = MemoryStore(db_path=db)
+        try:
+            pending = legacy.get_pending_reminders(now, window_minutes=2)
+        finally:
+            legacy.close()
+        assert [r["message"] for r in pending] == ["Old"]
+
+    def test_legacy_db_unparseable_row_skipped(self, tmp_path, caplog):
+        """A bad remind_at is left un-backfilled instead of failing startup."""
+        db = tmp_path / "legacy.db"
+        now = datetime.now()
+        self._legacy_db(db, [
+            ("Broken", "besok pagi"),
+            ("Old", (now + timedelta(minutes=3)).isoformat()),
+        ])
+
+        legacy = MemoryStore(db_path=db)
+        try:
+            pending = legacy.get_pending_reminders(now, window_minutes=2)
+        finally:
+            legacy.close()
+        assert [r["message"] for r in pending] == ["Old"]
+        assert "unparseable remind_at" in caplog.text
+
+
 class TestMarkDelivered:
     def test_delivered_not_in_pending(self, store):
         now = datetime.now()
@@ -98,13 +167,31 @@ class TestCancelReminder:
         assert store.cancel_reminder(9999) is False
 
 
+class TestAddRemindersBulk:
+    def test_returns_ids_in_order(self, store):
+        ids = store.add_reminders_bulk([
+            {"message": "First", "remind_at": "2026-03-02T08:00:00"},
+            {"message": "Second", "remind_at": "2026-03-02T09:00:00",
+             "is_alarm": True, "recurring": "daily"},
+        ])
+        by_id = {r["id"]: r for r in store.list_reminders()}
+        assert [by_id[i]["message"] for i in ids] == ["First", "Second"]
+        assert by_id[ids[1]]["is_alarm"] is True
+        assert by_id[ids[1]]["recurring"] == "daily"
+
+    def test_empty_rows(self, store):
+        assert store.add_reminders_bulk([]) == []
+
+
 class TestListReminders:
     def test_empty_list(self, store):
         assert store.list_reminders() == []
 
     def test_list_pending_only(self, store):
-        rid1 = store.add_reminder("Pending", "2026-03-02T08:00:00")
-        rid2 = store.add_reminder("Delivered", "2026-03-01T08:00:00")
+        rid1, rid2 = store.add_reminders_bulk([
+            {"message": "Pending", "remind_at": "2026-03-02T08:00:00"},
+            {"message": "Delivered", "remind_at": "2026-03-01T08:00:00"},
+        ])
         store.mark_reminder_delivered(rid2)
 
         pending = store.list_reminders(include_delivered=False)
@@ -112,8 +199,10 @@ class TestListReminders:
         assert pending[0]["id"] == rid1
 
     def test_list_all(self, store):
-        store.add_reminder("A", "2026-03-02T08:00:00")
-        rid2 = store.add_reminder("B", "2026-03-01T08:00:00")
+        _, rid2 = store.add_reminders_bulk([
+            {"message": "A", "remind_at": "2026-03-02T08:00:00"},
+            {"message": "B", "remind_at": "2026-03-01T08:00:00"},
+        ])
         store.mark_reminder_delivered(rid2)
 
         all_reminders = store.list_reminders(include_delivered=True)
@@ -155,6 +244,21 @@ class TestScheduleNextRecurrence:
         assert next_dt.weekday() == 0  # Monday
         assert next_r["remind_at"] == "2026-03-09T08:00:00"
 
+    @pytest.mark.parametrize(
+        ("start", "expected"),
+        [
+            ("2026-03-02T08:00:00", "2026-03-03T08:00:00"),  # Mon → Tue
+            ("2026-03-07T08:00:00", "2026-03-09T08:00:00"),  # Sat → Mon
+            ("2026-03-08T08:00:00", "2026-03-09T08:00:00"),  # Sun → Mon
+        ],
+    )
+    def test_weekdays_next_day(self, store, start, expected):
+        new_rid = store.schedule_next_recurrence(
+            {"message": "Weekday", "remind_at": start, "recurring": "weekdays"},
+        )
+        next_r = [r for r in store.list_reminders() if r["id"] == new_rid][0]
+        assert next_r["remind_at"] == expected
+
     def test_no_recurrence(self, store):
         store.add_reminder("One-time", "2026-03-01T08:00:00")
         reminder = store.list_reminders()[0]
@@ -164,20 +268,23 @@ class TestScheduleNextRecurrence:
 
 # ── NotificationQueue ────────────────────────────────────────────────
 
+# The queue never looks at the wall clock, so one fixed timestamp will do.
+_T0 = datetime(2026, 1, 1, 9, 0)
+
 
 class TestNotificationQueue:
     def test_push_and_size(self):
         q = NotificationQueue()
         assert q.is_empty()
-        q.push(Notification("hi", Urgency.PASSIVE, "test", datetime.now()))
+        q.push(Notification("hi", Urgency.PASSIVE, "test", _T0))
         assert q.size() == 1
         assert not q.is_empty()
 
     def test_get_passive(self):
         q = NotificationQueue()
-        q.push(Notification("p1", Urgency.PASSIVE, "test", datetime.now()))
-        q.push(Notification("g1", Urgency.GENTLE, "test", datetime.now()))
-        q.push(Notification("p2", Urgency.PASSIVE, "test", datetime.now()))
+        q.push(Notification("p1", Urgency.PASSIVE, "test", _T0))
+        q.push(Notification("g1", Urgency.GENTLE, "test", _T0))
+        q.push(Notification("p2", Urgency.PASSIVE, "test", _T0))
 
         passive = q.get_passive()
         assert len(passive) == 2
@@ -187,10 +294,9 @@ class TestNotificationQueue:
 
     def test_get_next_urgent_returns_highest_first(self):
         q = NotificationQueue()
-        now = datetime.now()
-        q.push(Notification("gentle", Urgency.GENTLE, "test", now))
-        q.push(Notification("active", Urgency.ACTIVE, "test", now))
-        q.push(Notification("passive", Urgency.PASSIVE, "test", now))
+        q.push(Notification("gentle", Urgency.GENTLE, "test", _T0))
+        q.push(Notification("active", Urgency.ACTIVE, "test", _T0))
+        q.push(Notification("passive", Urgency.PASSIVE, "test", _T0))
 
         notif = q.get_next_urgent()
         assert notif is not None
@@ -201,20 +307,20 @@ class TestNotificationQueue:
 
     def test_get_next_urgent_empty(self):
         q = NotificationQueue()
-        q.push(Notification("p", Urgency.PASSIVE, "test", datetime.now()))
+        q.push(Notification("p", Urgency.PASSIVE, "test", _T0))
         assert q.get_next_urgent() is None
 
     def test_has_urgent(self):
         q = NotificationQueue()
-        q.push(Notification("p", Urgency.PASSIVE, "test", datetime.now()))
+        q.push(Notification("p", Urgency.PASSIVE, "test", _T0))
         assert q.has_urgent() is False
-        q.push(Notification("g", Urgency.GENTLE, "test", datetime.now()))
+        q.push(Notification("g", Urgency.GENTLE, "test", _T0))
         assert q.has_urgent() is True
 
     def test_clear(self):
         q = NotificationQueue()
-        q.push(Notification("a", Urgency.ACTIVE, "test", datetime.now()))
-        q.push(Notification("b", Urgency.GENTLE, "test", datetime.now()))
+        q.push(Notification("a", Urgency.ACTIVE, "test", _T0))
+        q.push(Notification("b", Urgency.GENTLE, "test", _T0))
         q.clear()
         assert q.is_empty()
 
@@ -224,10 +330,10 @@ class TestNotificationQueue:
         count = 100
 
         def push_batch(start):
-            for i in range(start, start + count):
-                q.push(Notification(
-                    f"msg-{i}", Urgency.PASSIVE, "test", datetime.now(),
-                ))
+            q.push_many([
+                Notification(f"msg-{i}", Urgency.PASSIVE, "test", _T0)
+                for i in range(start, start + count)
+            ])
 
         threads = [threading.Thread(target=push_batch, args=(i * count,))
                    for i in range(4)]
@@ -238,6 +344,19 @@ class TestNotificationQueue:
 
         assert q.size() == 4 * count
 
+    def test_push_many_keeps_ordering(self):
+        q = NotificationQueue()
+        t1 = datetime(2026, 1, 1, 10, 0)
+        t2 = datetime(2026, 1, 1, 11, 0)
+        q.push_many([
+            Notification("later", Urgency.GENTLE, "test", t2),
+            Notification("active", Urgency.ACTIVE, "test", t2),
+            Notification("earlier", Urgency.GENTLE, "test", t1),
+        ])
+        assert [q.get_next_urgent().message for _ in range(3)] == [
+            "active", "earlier", "later",
+        ]
+
     def test_urgency_ordering_same_level(self):
         """When multiple GENTLE notifications, oldest first."""
         q = NotificationQueue()
@@ -1,5 +1,6 @@
 """Tests for heartbeat orchestrator integration — notification context, delivery, and lifecycle."""
 
+import importlib.util
 import sys
 from datetime import datetime
 from unittest.mock import MagicMock, patch
@@ -12,39 +13,45 @@ from nova.memory.prompt_assembler import PromptAssembler
 # ── Prompt Assembler: Notification Context ─────────────────────────────
 
 
+@pytest.fixture(scope="module")
+def assembler(tmp_path_factory):
+    """One PromptAssembler (and prompts directory) for the whole module."""
+    return PromptAssembler(prompts_dir=tmp_path_factory.mktemp("prompts"))
+
+
 class TestNotificationContext:
     """Test notification context injection in PromptAssembler."""
 
     @pytest.fixture(autouse=True)
-    def _setup(self, tmp_path):
-        self.assembler = PromptAssembler(prompts_dir=tmp_path)
+    def _reset(self, assembler):
+        assembler.reset()
 
-    def test_notification_context_in_build(self):
+    def test_notification_context_in_build(self, assembler):
         """Notification context should appear in the assembled prompt."""
-        self.assembler.set_notification_context("Remind the user: Ujian jam 8")
-        prompt = self.assembler.build()
+        assembler.set_notification_context("Remind the user: Ujian jam 8")
+        prompt = assembler.build()
         assert "Pending notifications to deliver" in prompt
         assert "Remind the user: Ujian jam 8" in prompt
 
-    def test_notification_context_consumed_after_build(self):
+    def test_notification_context_consumed_after_build(self, assembler):
         """Notification context should be cleared after build()."""
-        self.assembler.set_notification_context("Test notification")
-        self.assembler.build()
+        assembler.set_notification_context("Test notification")
+        assembler.build()
         # Second build should have no notification context
-        prompt2 = self.assembler.build()
+        prompt2 = assembler.build()
         assert "Pending notifications" not in prompt2
 
-    def test_notification_and_memory_context_coexist(self):
+    def test_notification_and_memory_context_coexist(self, assembler):
         """Both memory and notification context should appear together."""
-        self.assembler.set_memory_context("User likes coffee")
-        self.assembler.set_notification_context("Morning greeting")
-        prompt = self.assembler.build()
+        assembler.set_memory_context("User likes coffee")
+        assembler.set_notification_context("Morning greeting")
+        prompt = assembler.build()
         assert "Relevant memories" in prompt
         assert "Pending notifications" in prompt
 
-    def test_no_notification_section_when_empty(self):
+    def test_no_notification_section_when_empty(self, assembler):
         """No notification section when no context is set."""
-        prompt = self.assembler.build()
+        prompt = assembler.build()
         assert "Pending notifications" not in prompt
 
 
@@ -55,9 +62,16 @@ class TestNotificationContext:
 
 @pytest.fixture(scope="module")
 def orchestrator_module():
-    """Import orchestrator module with psutil mocked out."""
-    psutil_mock = MagicMock()
-    with patch.dict(sys.modules, {"psutil": psutil_mock}):
+    """Import orchestrator module, mocking psutil out if it isn't installed.
+
+    Only the ``psutil`` entry is swapped: restoring all of sys.modules
+    would evict numpy & co. imported along the way, and numpy cannot be
+    imported twice in one process (e.g. when this file runs first on an
+    xdist worker).
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        if importlib.util.find_spec("psutil") is None:
+            mp.setitem(sys.modules, "psutil", MagicMock())
         from nova import orchestrator as orch_mod
     return orch_mod
 
@@ -129,24 +143,31 @@ class TestFormatNotifications:
 
 # ── Orchestrator: Heartbeat Lifecycle ───────────────────────────────
 
+# Collaborators replaced with mocks when constructing a real Orchestrator.
+_ORCH_PATCHED = (
+    "get_config", "get_memory_store", "get_embedder", "get_prompt_assembler",
+    "GeminiProvider", "GroqWhisperProvider", "EdgeTTSProvider",
+    "ProviderRouter", "ConversationManager", "StreamingTTSPlayer",
+    "get_tool_declarations", "HeartbeatScheduler",
+)
 
-class TestHeartbeatLifecycle:
-    """Test heartbeat scheduler start/stop via orchestrator."""
 
-    def test_scheduler_starts_when_enabled(self, orchestrator_module):
-        """HeartbeatScheduler.start() should be called when heartbeat_enabled=True."""
-        with patch.object(orchestrator_module, "get_config") as mock_config, \
-             patch.object(orchestrator_module, "get_memory_store"), \
-             patch.object(orchestrator_module, "get_embedder", return_value=None), \
-             patch.object(orchestrator_module, "get_prompt_assembler"), \
-             patch.object(orchestrator_module, "GeminiProvider"), \
-             patch.object(orchestrator_module, "GroqWhisperProvider"), \
-             patch.object(orchestrator_module, "EdgeTTSProvider"), \
-             patch.object(orchestrator_module, "ProviderRouter"), \
-             patch.object(orchestrator_module, "ConversationManager"), \
-             patch.object(orchestrator_module, "StreamingTTSPlayer"), \
-             patch.object(orchestrator_module, "get_tool_declarations"), \
-             patch.object(orchestrator_module, "HeartbeatScheduler") as mock_scheduler:
+@pytest.fixture(scope="module")
+def mocked_orch_factory(orchestrator_module):
+    """Replace the orchestrator's collaborators once for the whole module.
+
+    Returns ``make(**cfg_overrides) -> (orchestrator, mocks)``. The mocks are
+    reset on every call so per-test assertions start from a clean slate.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mocks = {name: MagicMock() for name in _ORCH_PATCHED}
+        for name, mock in mocks.items():
+            mp.setattr(orchestrator_module, name, mock)
+        mocks["get_embedder"].return_value = None
+
+        def make(**cfg_overrides):
+            for mock in mocks.values():
+                mock.reset_mock()
             cfg = MagicMock()
             cfg.heartbeat_enabled = True
             cfg.gemini_api_key = "test-key"
@@ -155,38 +176,27 @@ class TestHeartbeatLifecycle:
             cfg.cloudflare_api_token = ""
             cfg.google_cloud_tts_key_path = ""
             cfg.embedding_enabled = False
-            mock_config.return_value = cfg
+            for key, value in cfg_overrides.items():
+                setattr(cfg, key, value)
+            mocks["get_config"].return_value = cfg
+            return orchestrator_module.Orchestrator(), mocks
 
-            orchestrator_module.Orchestrator()
-            mock_scheduler.return_value.start.assert_called_once()
+        yield make
 
-    def test_scheduler_stop_on_orchestrator_stop(self, orchestrator_module):
-        """orchestrator.stop() should call scheduler.stop()."""
-        with patch.object(orchestrator_module, "get_config") as mock_config, \
-             patch.object(orchestrator_module, "get_memory_store"), \
-             patch.object(orchestrator_module, "get_embedder", return_value=None), \
-             patch.object(orchestrator_module, "get_prompt_assembler"), \
-             patch.object(orchestrator_module, "GeminiProvider"), \
-             patch.object(orchestrator_module, "GroqWhisperProvider"), \
-             patch.object(orchestrator_module, "EdgeTTSProvider"), \
-             patch.object(orchestrator_module, "ProviderRouter"), \
-             patch.object(orchestrator_module, "ConversationManager"), \
-             patch.object(orchestrator_module, "StreamingTTSPlayer"), \
-             patch.object(orchestrator_module, "get_tool_declarations"), \
-             patch.object(orchestrator_module, "HeartbeatScheduler") as mock_scheduler:
-            cfg = MagicMock()
-            cfg.heartbeat_enabled = True
-            cfg.gemini_api_key = "test-key"
-            cfg.groq_api_key = ""
-            cfg.cloudflare_account_id = ""
-            cfg.cloudflare_api_token = ""
-            cfg.google_cloud_tts_key_path = ""
-            cfg.embedding_enabled = False
-            mock_config.return_value = cfg
 
-            orch = orchestrator_module.Orchestrator()
-            orch.stop()
-            mock_scheduler.return_value.stop.assert_called_once()
+class TestHeartbeatLifecycle:
+    """Test heartbeat scheduler start/stop via orchestrator."""
+
+    def test_scheduler_starts_when_enabled(self, mocked_orch_factory):
+        """HeartbeatScheduler.start() should be called when heartbeat_enabled=True."""
+        _, mocks = mocked_orch_factory(heartbeat_enabled=True)
+        mocks["HeartbeatScheduler"].return_value.start.assert_called_once()
+
+    def test_scheduler_stop_on_orchestrator_stop(self, mocked_orch_factory):
+        """orchestrator.stop() should call scheduler.stop()."""
+        orch, mocks = mocked_orch_factory(heartbeat_enabled=True)
+        orch.stop()
+        mocks["HeartbeatScheduler"].return_value.stop.assert_called_once()
 
 
 # ── Orchestrator: Passive Injection ────────────────────────────────
@@ -242,29 +252,7 @@ class TestPassiveInjection:
 class TestNotificationQueueProperty:
     """Test that notification_queue property works correctly."""
 
-    def test_queue_accessible(self, orchestrator_module):
+    def test_queue_accessible(self, mocked_orch_factory):
         """notification_queue property should return the internal queue."""
-        with patch.object(orchestrator_module, "get_config") as mock_config, \
-             patch.object(orchestrator_module, "get_memory_store"), \
-             patch.object(orchestrator_module, "get_embedder", return_value=None), \
-             patch.object(orchestrator_module, "get_prompt_assembler"), \
-             patch.object(orchestrator_module, "GeminiProvider"), \
-             patch.object(orchestrator_module, "GroqWhisperProvider"), \
-             patch.object(orchestrator_module, "EdgeTTSProvider"), \
-             patch.object(orchestrator_module, "ProviderRouter"), \
-             patch.object(orchestrator_module, "ConversationManager"), \
-             patch.object(orchestrator_module, "StreamingTTSPlayer"), \
-             patch.object(orchestrator_module, "get_tool_declarations"), \
-             patch.object(orchestrator_module, "HeartbeatScheduler"):
-            cfg = MagicMock()
-            cfg.heartbeat_enabled = False
-            cfg.gemini_api_key = "test"
-            cfg.groq_api_key = ""
-            cfg.cloudflare_account_id = ""
-            cfg.cloudflare_api_token = ""
-            cfg.google_cloud_tts_key_path = ""
-            cfg.embedding_enabled = False
-            mock_config.return_value = cfg
-
-            orch = orchestrator_module.Orchestrator()
-            assert isinstance(orch.notification_queue, NotificationQueue)
+        orch, _ = mocked_orch_factory(heartbeat_enabled=False, gemini_api_key="test")
+        assert isinstance(orch.notification_queue, NotificationQueue)
@@ -1,7 +1,7 @@
 """Tests for HeartbeatScheduler — reminder scanning, rules, and urgency logic."""
 
-import time
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,43 +9,74 @@ import pytest
 from nova.heartbeat.queue import NotificationQueue, Urgency
 from nova.heartbeat.scheduler import HeartbeatScheduler
 
+# Heartbeat defaults applied to the stand-in NovaConfig before every test
+_CONFIG_DEFAULTS = {
+    "heartbeat_enabled": True,
+    "heartbeat_interval": 60,
+    "quiet_hours_start": 23,
+    "quiet_hours_end": 6,
+    "morning_greeting_enabled": True,
+    "sleep_reminder_enabled": True,
+    "ambient_presence_threshold": 0.005,
+    "chime_volume": 0.3,
+    "alert_volume": 0.5,
+    "gentle_listen_timeout": 5,
+    "gentle_max_retries": 3,
+    "gentle_retry_delay": 300,
+}
+
+# Fixed clock readings on one day (quiet hours run 23:00-06:00 by default)
+_EARLY_QUIET = datetime(2026, 3, 1, 2, 0)
+_BEFORE_MORNING = datetime(2026, 3, 1, 5, 59)
+_MORNING = datetime(2026, 3, 1, 7, 30)
+_AFTER_MORNING = datetime(2026, 3, 1, 10, 0)
+_AFTERNOON = datetime(2026, 3, 1, 14, 0)
+_BEDTIME = datetime(2026, 3, 1, 23, 0)
+_LATE = datetime(2026, 3, 1, 23, 30)
+_TODAY = _AFTERNOON.date()
+
+
+# Fields shared by the reminder rows the mock store hands the scheduler
+_BASE_REMINDER = {
+    "lead_time": 5,
+    "is_alarm": False,
+    "urgency": 2,
+    "recurring": None,
+}
+
+
+def _apply_store_defaults(store: MagicMock) -> None:
+    """Give the mock MemoryStore's reminder methods their default returns."""
+    store.get_pending_reminders.return_value = []
+    store.mark_reminder_delivered.return_value = None
+    store.schedule_next_recurrence.return_value = None
+
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def mock_config():
-    """Create a mock NovaConfig with heartbeat defaults."""
-    config = MagicMock()
-    config.heartbeat_enabled = True
-    config.heartbeat_interval = 60
-    config.quiet_hours_start = 23
-    config.quiet_hours_end = 6
-    config.morning_greeting_enabled = True
-    config.sleep_reminder_enabled = True
-    config.ambient_presence_threshold = 0.005
-    config.chime_volume = 0.3
-    config.alert_volume = 0.5
-    config.gentle_listen_timeout = 5
-    config.gentle_max_retries = 3
-    config.gentle_retry_delay = 300
-    return config
-
-
-@pytest.fixture
+    """Create a stand-in NovaConfig with heartbeat defaults.
+
+    A plain namespace rather than a MagicMock: the scheduler only reads
+    these attributes, and a typo'd name should fail loudly.
+    """
+    return SimpleNamespace(**_CONFIG_DEFAULTS)
+
+
+@pytest.fixture(scope="class")
 def mock_store():
     """Create a mock MemoryStore with reminder methods."""
     store = MagicMock()
-    store.get_pending_reminders.return_value = []
-    store.mark_reminder_delivered.return_value = None
-    store.schedule_next_recurrence.return_value = None
+    _apply_store_defaults(store)
     return store
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def queue():
-    """Create a fresh NotificationQueue."""
+    """Create a NotificationQueue shared by the tests of one class."""
     return NotificationQueue()
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def scheduler(mock_store, queue, mock_config):
     """Create a HeartbeatScheduler with mocked dependencies."""
     return HeartbeatScheduler(
@@ -55,21 +86,33 @@ def scheduler(mock_store, queue, mock_config):
     )
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared(mock_config, mock_store, queue, scheduler):
+    """Return the class-scoped fixtures to a pristine state before each test."""
+    for key, value in _CONFIG_DEFAULTS.items():
+        setattr(mock_config, key, value)
+    mock_store.reset_mock(return_value=True, side_effect=True)
+    _apply_store_defaults(mock_store)
+    queue.clear()
+    scheduler._morning_greeted = False
+    scheduler._sleep_reminded = False
+    scheduler._last_reset_date = None
+    scheduler._tick_count = 0
+    scheduler._tick_event.clear()
+
+
 # ── Reminder Checking ────────────────────────────────────────────────
 
 
 class TestCheckReminders:
     def test_pending_reminder_pushed_to_queue(self, scheduler, mock_store, queue):
         """Pending reminder should be pushed to queue with correct urgency."""
-        now = datetime(2026, 3, 1, 14, 0)  # 2pm, not quiet hours
+        now = _AFTERNOON  # not quiet hours
         mock_store.get_pending_reminders.return_value = [{
+            **_BASE_REMINDER,
             "id": 1,
             "message": "Ujian",
             "remind_at": now + timedelta(minutes=3),
-            "lead_time": 5,
-            "is_alarm": False,
-            "urgency": 2,
-            "recurring": None,
         }]
 
         scheduler._check_reminders(now)
@@ -84,15 +127,13 @@ class TestCheckReminders:
 
     def test_quiet_hours_downgrade_non_alarm(self, scheduler, mock_store, queue):
         """During quiet hours, non-alarm reminders → PASSIVE."""
-        now = datetime(2026, 3, 1, 23, 30)  # 11:30pm = quiet hours
+        now = _LATE  # quiet hours
         mock_store.get_pending_reminders.return_value = [{
+            **_BASE_REMINDER,
             "id": 2,
             "message": "Late reminder",
             "remind_at": now + timedelta(minutes=1),
-            "lead_time": 5,
-            "is_alarm": False,
             "urgency": 3,  # ACTIVE
-            "recurring": None,
         }]
 
         scheduler._check_reminders(now)
@@ -105,15 +146,14 @@ class TestCheckReminders:
 
     def test_alarm_bypasses_quiet_hours(self, scheduler, mock_store, queue):
         """Alarms keep original urgency even during quiet hours."""
-        now = datetime(2026, 3, 1, 2, 0)  # 2am = quiet hours
+        now = _EARLY_QUIET  # quiet hours
         mock_store.get_pending_reminders.return_value = [{
+            **_BASE_REMINDER,
             "id": 3,
             "message": "Wake up!",
             "remind_at": now + timedelta(minutes=1),
-            "lead_time": 5,
             "is_alarm": True,
             "urgency": 3,
-            "recurring": None,
         }]
 
         scheduler._check_reminders(now)
@@ -124,14 +164,12 @@ class TestCheckReminders:
 
     def test_recurring_schedules_next(self, scheduler, mock_store, queue):
         """Recurring reminders should schedule next occurrence after delivery."""
-        now = datetime(2026, 3, 1, 14, 0)
+        now = _AFTERNOON
         reminder = {
+            **_BASE_REMINDER,
             "id": 4,
             "message": "Daily standup",
             "remind_at": now + timedelta(minutes=1),
-            "lead_time": 5,
-            "is_alarm": False,
-            "urgency": 2,
             "recurring": "daily",
         }
         mock_store.get_pending_reminders.return_value = [reminder]
@@ -156,15 +194,13 @@ class TestAmbientGate:
             ambient_fn=ambient_fn,
         )
 
-        now = datetime(2026, 3, 1, 14, 0)  # not quiet hours
+        now = _AFTERNOON  # not quiet hours
         mock_store.get_pending_reminders.return_value = [{
+            **_BASE_REMINDER,
             "id": 5,
             "message": "Test",
             "remind_at": now + timedelta(minutes=1),
-            "lead_time": 5,
-            "is_alarm": False,
             "urgency": 2,  # GENTLE
-            "recurring": None,
         }]
 
         sched._check_reminders(now)
@@ -183,15 +219,12 @@ class TestAmbientGate:
             ambient_fn=ambient_fn,
         )
 
-        now = datetime(2026, 3, 1, 14, 0)
+        now = _AFTERNOON
         mock_store.get_pending_reminders.return_value = [{
+            **_BASE_REMINDER,
             "id": 6,
             "message": "Test",
             "remind_at": now + timedelta(minutes=1),
-            "lead_time": 5,
-            "is_alarm": False,
-            "urgency": 2,
-            "recurring": None,
         }]
 
         sched._check_reminders(now)
@@ -207,7 +240,7 @@ class TestAmbientGate:
 class TestBuiltinRules:
     def test_morning_greeting_fires_once(self, scheduler, queue):
         """Morning greeting should fire once between 06-10, not again."""
-        now = datetime(2026, 3, 1, 7, 30)
+        now = _MORNING
         scheduler._last_reset_date = now.date()
 
         scheduler._check_builtin_rules(now)
@@ -222,19 +255,19 @@ class TestBuiltinRules:
 
     def test_morning_greeting_not_outside_hours(self, scheduler, queue):
         """Morning greeting should NOT fire outside 06-10."""
-        scheduler._last_reset_date = datetime(2026, 3, 1).date()
+        scheduler._last_reset_date = _TODAY
 
-        scheduler._check_builtin_rules(datetime(2026, 3, 1, 5, 59))
+        scheduler._check_builtin_rules(_BEFORE_MORNING)
         assert queue.is_empty()
 
-        scheduler._check_builtin_rules(datetime(2026, 3, 1, 10, 0))
+        scheduler._check_builtin_rules(_AFTER_MORNING)
         assert queue.is_empty()
 
     def test_sleep_reminder_fires_once(self, scheduler, queue, mock_config):
         """Sleep reminder at 23:00, once per night."""
         # Adjust quiet hours so 23 is NOT quiet (to allow GENTLE)
         mock_config.quiet_hours_start = 24  # effectively disabled
-        now = datetime(2026, 3, 1, 23, 0)
+        now = _BEDTIME
         scheduler._last_reset_date = now.date()
 
         scheduler._check_builtin_rules(now)
@@ -251,18 +284,18 @@ class TestBuiltinRules:
     def test_morning_greeting_disabled(self, scheduler, queue, mock_config):
         """Morning greeting should not fire when disabled in config."""
         mock_config.morning_greeting_enabled = False
-        scheduler._last_reset_date = datetime(2026, 3, 1).date()
+        scheduler._last_reset_date = _TODAY
 
-        scheduler._check_builtin_rules(datetime(2026, 3, 1, 7, 30))
+        scheduler._check_builtin_rules(_MORNING)
         assert queue.is_empty()
 
     def test_sleep_reminder_disabled(self, scheduler, queue, mock_config):
         """Sleep reminder should not fire when disabled in config."""
         mock_config.sleep_reminder_enabled = False
         mock_config.quiet_hours_start = 24
-        scheduler._last_reset_date = datetime(2026, 3, 1).date()
+        scheduler._last_reset_date = _TODAY
 
-        scheduler._check_builtin_rules(datetime(2026, 3, 1, 23, 0))
+        scheduler._check_builtin_rules(_BEDTIME)
         assert queue.is_empty()
 
 
@@ -272,13 +305,13 @@ class TestBuiltinRules:
 class TestDailyReset:
     def test_flags_reset_at_midnight(self, scheduler, queue):
         """Daily flags should reset when date changes."""
-        day1 = datetime(2026, 3, 1, 7, 0)
+        day1 = _MORNING
         scheduler._maybe_reset_daily_flags(day1)
         scheduler._morning_greeted = True
         scheduler._sleep_reminded = True
 
         # Next day
-        day2 = datetime(2026, 3, 2, 7, 0)
+        day2 = _MORNING + timedelta(days=1)
         scheduler._maybe_reset_daily_flags(day2)
         assert scheduler._morning_greeted is False
         assert scheduler._sleep_reminded is False
@@ -288,18 +321,20 @@ class TestDailyReset:
 
 
 class TestQuietHours:
-    def test_is_quiet_late_night(self, scheduler):
-        assert scheduler._is_quiet(datetime(2026, 3, 1, 23, 0)) is True
-        assert scheduler._is_quiet(datetime(2026, 3, 1, 23, 59)) is True
-
-    def test_is_quiet_early_morning(self, scheduler):
-        assert scheduler._is_quiet(datetime(2026, 3, 1, 0, 0)) is True
-        assert scheduler._is_quiet(datetime(2026, 3, 1, 5, 59)) is True
+    @pytest.mark.parametrize(
+        ("hour", "expected"),
+        [(23, True), (0, True), (5, True), (6, False), (14, False), (22, False)],
+    )
+    def test_is_quiet_hour(self, scheduler, hour, expected):
+        assert scheduler._is_quiet_hour(hour) is expected
 
-    def test_not_quiet_daytime(self, scheduler):
-        assert scheduler._is_quiet(datetime(2026, 3, 1, 6, 0)) is False
-        assert scheduler._is_quiet(datetime(2026, 3, 1, 14, 0)) is False
-        assert scheduler._is_quiet(datetime(2026, 3, 1, 22, 59)) is False
+    @pytest.mark.parametrize(
+        ("hour", "minute", "expected"),
+        [(23, 59, True), (5, 59, True), (22, 59, False)],
+    )
+    def test_is_quiet_uses_hour_only(self, scheduler, hour, minute, expected):
+        now = _AFTERNOON.replace(hour=hour, minute=minute)
+        assert scheduler._is_quiet(now) is expected
 
 
 # ── Tick Integration ──────────────────────────────────────────────────
@@ -321,18 +356,18 @@ class TestTick:
 
 
 class TestThreadLifecycle:
-    def test_start_stop(self, scheduler, mock_config):
+    def test_start_stop(self, scheduler):
         """Scheduler should start and stop cleanly."""
-        mock_config.heartbeat_interval = 0.1  # fast for testing
         scheduler.start()
         assert scheduler.is_running
-        time.sleep(0.3)  # let a few ticks run
+        # Wait for the first tick; the 60s interval wait is cut short by stop()
+        assert scheduler._tick_event.wait(timeout=5)
+        assert scheduler._tick_count == 1
         scheduler.stop()
         assert not scheduler.is_running
 
-    def test_double_start_no_crash(self, scheduler, mock_config):
+    def test_double_start_no_crash(self, scheduler):
         """Starting twice should not crash or create duplicate threads."""
-        mock_config.heartbeat_interval = 0.1
         scheduler.start()
         scheduler.start()  # should log warning, not crash
         scheduler.stop()
@@ -1,19 +1,11 @@
 """Tests for MemoryStore — SQLite-backed memory system."""
 
+import numpy as np
 import pytest
 
 from nova.memory.memory_store import MemoryStore
 
 
-@pytest.fixture
-def store(tmp_path):
-    """Create a MemoryStore with a temporary database."""
-    db = tmp_path / "test.db"
-    s = MemoryStore(db_path=db)
-    yield s
-    s.close()
-
-
 class TestMemoryCRUD:
     def test_store_and_get_memory(self, store):
         store.store_memory("name", "Zhafran")
@@ -28,8 +20,9 @@ class TestMemoryCRUD:
         assert store.get_memory("doesnotexist") is None
 
     def test_get_all_memories(self, store):
-        store.store_memory("a", "1")
-        store.store_memory("b", "2")
+        with store.batch():
+            store.store_memory("a", "1")
+            store.store_memory("b", "2")
         all_mem = store.get_all_memories()
         assert "a" in all_mem
         assert "b" in all_mem
@@ -45,8 +38,9 @@ class TestMemoryCRUD:
 
     def test_memory_count(self, store):
         assert store.memory_count() == 0
-        store.store_memory("a", "1")
-        store.store_memory("b", "2")
+        with store.batch():
+            store.store_memory("a", "1")
+            store.store_memory("b", "2")
         assert store.memory_count() == 2
 
     def test_key_normalization(self, store):
@@ -71,29 +65,32 @@ class TestFTS5Search:
         results = store.search_memories_fts("nonexistent query xyz")
         assert results == []
 
-    def test_search_respects_limit(self, store):
-        for i in range(10):
-            store.store_memory(f"item{i}", f"value item {i}")
-        results = store.search_memories_fts("item", limit=3)
-        assert len(results) <= 3
-
-    def test_search_with_special_characters(self, store):
-        """FTS5 should not crash on queries with ?, !, etc."""
-        store.store_memory("hobby", "programming")
-        # These should NOT raise sqlite3.OperationalError
-        results = store.search_memories_fts("hobby?")
-        assert len(results) >= 1  # "hobby?" → "hobby" matches
-        results = store.search_memories_fts("hobby!")
-        assert len(results) >= 1  # "hobby!" → "hobby" matches
-        # Multi-word with special chars — should not crash even if no match
-        store.search_memories_fts('hobby "test"')
-        store.search_memories_fts("hobby (test)")
-        store.search_memories_fts("what? where! how*")
-
-    def test_search_all_special_chars_returns_empty(self, store):
-        """Query with only special characters should return empty."""
-        results = store.search_memories_fts("???!!!")
-        assert results == []
+    def test_search_respects_limit(self, populated_store):
+        results = populated_store.search_memories_fts("item", limit=3)
+        assert len(results) == 3
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("hobby?", 1),  # "hobby?" → "hobby" matches
+            ("hobby!", 1),
+            # Multi-word with special chars — should not crash even if no match
+            ('hobby "test"', 0),
+            ("hobby (test)", 0),
+            ("what? where! how*", 0),
+            # Only special characters → empty query, no results
+            ("???!!!", 0),
+        ],
+    )
+    def test_search_with_special_characters(
+        self, populated_store_template, query, expected,
+    ):
+        """FTS5 should not crash on queries with ?, !, etc.
+
+        Read-only, so every case searches the shared session template.
+        """
+        results = populated_store_template.search_memories_fts(query)
+        assert len(results) == expected
 
 
 class TestInteractions:
@@ -133,12 +130,20 @@ class TestSessions:
 class TestEmbeddings:
     def test_store_and_retrieve_embedding(self, store):
         store.store_memory("test", "value")
-        emb = [0.1, 0.2, 0.3]
+        emb = np.array([0.1, 0.2, 0.3], dtype=np.float32)
         store.store_embedding("test", emb)
         results = store.get_memories_with_embeddings()
         assert len(results) == 1
-        assert len(results[0]["embedding"]) == 3
-        assert abs(results[0]["embedding"][0] - 0.1) < 1e-5
+        assert results[0]["embedding"].dtype == np.float32
+        assert np.allclose(results[0]["embedding"], emb)
+
+    def test_list_and_array_store_same_bytes(self, store):
+        store.store_memory("a", "1")
+        store.store_memory("b", "2")
+        store.store_embedding("a", [0.5, -1.25])
+        store.store_embedding("b", np.array([0.5, -1.25]))
+        a, b = store.get_memories_with_embeddings()
+        assert a["embedding"].tobytes() == b["embedding"].tobytes()
 
 
 class TestMigration:
@@ -159,6 +164,7 @@ class TestMemoryMD:
         db = tmp_path / "nova.db"
         store = MemoryStore(db_path=db)
         store.store_memory("name", "Zhafran")
+        store.flush_memory_md()
 
         md_path = tmp_path / "MEMORY.md"
         assert md_path.exists()
@@ -166,3 +172,120 @@ class TestMemoryMD:
         assert "name" in content
         assert "Zhafran" in content
         store.close()
+
+    def test_sync_disabled_writes_no_file(self, tmp_path):
+        store = MemoryStore(db_path=tmp_path / "nova.db", sync_memory_md=False)
+        store.store_memory("name", "Zhafran")
+
+        assert not (tmp_path / "MEMORY.md").exists()
+        assert store.get_memory("name") == "Zhafran"
+        store.close()
+
+    def test_burst_of_changes_written_once(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("nova.memory.memory_store._MD_SYNC_DELAY", 60)
+        store = MemoryStore(db_path=tmp_path / "nova.db")
+        writes = []
+        monkeypatch.setattr(store, "_write_memory_md", writes.append)
+        store.store_memory("a", "1")
+        store.store_memory("b", "2")
+        store.delete_memory("a")
+
+        assert writes == []
+        store.flush_memory_md()
+        store.flush_memory_md()
+        assert writes == [{"b": "2"}]
+        store.close()
+
+    def test_timer_writes_after_delay(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("nova.memory.memory_store._MD_SYNC_DELAY", 0.01)
+        store = MemoryStore(db_path=tmp_path / "nova.db")
+        store.store_memory("name", "Zhafran")
+        timer = store._md_timer  # cleared once it fires, so keep a handle
+        timer.join(timeout=5)
+
+        content = (tmp_path / "MEMORY.md").read_text(encoding="utf-8")
+        assert "**name**: Zhafran" in content
+        store.close()
+
+    def test_close_flushes_pending_write(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("nova.memory.memory_store._MD_SYNC_DELAY", 60)
+        store = MemoryStore(db_path=tmp_path / "nova.db")
+        store.store_memory("name", "Zhafran")
+        store.close()
+
+        assert "Zhafran" in (tmp_path / "MEMORY.md").read_text(encoding="utf-8")
+
+
+class TestBulkStore:
+    def test_inserts_and_updates(self, store):
+        store.store_memory("city", "Jakarta")
+        store.bulk_store_memories([("City", "Bekasi"), ("hobby", " gitar ")])
+        assert store.get_memory("city") == "Bekasi"
+        assert store.get_memory("hobby") == "gitar"
+        assert store.memory_count() == 2
+        assert store.search_memories_fts("Bekasi")[0]["key"] == "city"
+
+    def test_empty_batch(self, store):
+        store.bulk_store_memories([])
+        assert store.memory_count() == 0
+
+
+class TestDurability:
+    def test_off_skips_fsync_and_disk_journal(self, tmp_path):
+        store = MemoryStore(db_path=tmp_path / "nova.db", durability="off")
+        conn = store._conn
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        store.store_memory("a", "1")
+        assert store.get_memory("a") == "1"
+        store.close()
+
+    def test_unknown_level_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="durability"):
+            MemoryStore(db_path=tmp_path / "nova.db", durability="fast")
+
+
+class TestBatch:
+    def test_commits_once_on_exit(self, store):
+        with store.batch():
+            store.store_memory("a", "1")
+            with store.batch():
+                store.add_reminder("Meeting", "2026-03-01T10:00:00")
+            assert store._conn.in_transaction
+        assert not store._conn.in_transaction
+        assert store.get_memory("a") == "1"
+        assert len(store.list_reminders()) == 1
+
+    def test_rolls_back_on_error(self, store):
+        store.store_memory("kept", "yes")
+        with pytest.raises(RuntimeError), store.batch():
+            store.store_memory("a", "1")
+            store.bulk_store_memories([("b", "2")])
+            raise RuntimeError("boom")
+        assert store.get_all_memories() == {"kept": "yes"}
+
+    def test_memory_md_synced_after_batch(self, tmp_path):
+        store = MemoryStore(db_path=tmp_path / "nova.db")
+        md_path = tmp_path / "MEMORY.md"
+        with store.batch():
+            store.store_memory("a", "1")
+            store.store_memory("b", "2")
+            store.flush_memory_md()
+            assert not md_path.exists()
+        store.flush_memory_md()
+        content = md_path.read_text(encoding="utf-8")
+        assert "**a**: 1" in content
+        assert "**b**: 2" in content
+        store.close()
+
+
+class TestCloneInMemory:
+    def test_clone_is_independent_and_searchable(self, store):
+        store.store_memory("hobby", "bermain gitar")
+        clone = store.clone_in_memory()
+        try:
+            clone.store_memory("city", "Bekasi")
+            assert clone.search_memories_fts("gitar")[0]["key"] == "hobby"
+            assert store.get_memory("city") is None
+        finally:
+            clone.close()
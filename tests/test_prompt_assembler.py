@@ -1,15 +1,26 @@
 """Tests for PromptAssembler — file-based prompt system."""
 
+import os
+import shutil
+
 import pytest
 
 from nova.memory.prompt_assembler import PromptAssembler
 
 
+@pytest.fixture(scope="session")
+def _template_prompts_dir(tmp_path_factory):
+    """A prompts directory holding the default files, written once."""
+    d = tmp_path_factory.mktemp("prompts_template")
+    PromptAssembler(prompts_dir=d)
+    return d
+
+
 @pytest.fixture
-def prompts_dir(tmp_path):
-    """Create a temporary prompts directory."""
+def prompts_dir(tmp_path, _template_prompts_dir):
+    """Create a temporary prompts directory pre-filled with the defaults."""
     d = tmp_path / "prompts"
-    d.mkdir()
+    shutil.copytree(_template_prompts_dir, d)
     return d
 
 
@@ -90,10 +101,10 @@ class TestPromptAssembler:
         p1 = assembler.build(datetime_str="t")
         assert "V1" in p1
 
-        # Force mtime change
-        import time
-        time.sleep(0.05)
+        # Force the mtime forward; no sleep, works on 1s-granularity filesystems
         soul.write_text("V2", encoding="utf-8")
+        new_mtime = soul.stat().st_mtime + 10
+        os.utime(soul, (new_mtime, new_mtime))
 
         p2 = assembler.build(datetime_str="t")
         assert "V2" in p2
@@ -123,3 +134,12 @@ class TestPromptAssembler:
     def test_prompts_dir_property(self, prompts_dir):
         assembler = PromptAssembler(prompts_dir=prompts_dir)
         assert assembler.prompts_dir == prompts_dir
+
+    def test_reset_clears_pending_context(self, prompts_dir):
+        assembler = PromptAssembler(prompts_dir=prompts_dir)
+        assembler.set_memory_context("User likes coffee")
+        assembler.set_notification_context("Morning greeting")
+        assembler.reset()
+        prompt = assembler.build(datetime_str="t")
+        assert "Relevant memories" not in prompt
+        assert "Pending notifications" not in prompt
@@ -1,20 +1,11 @@
 """Tests for MemoryRetriever — hybrid FTS5 + vector search."""
 
+import numpy as np
 import pytest
 
-from nova.memory.memory_store import MemoryStore
 from nova.memory.retriever import MemoryRetriever
 
 
-@pytest.fixture
-def store(tmp_path):
-    """Create a MemoryStore with a temporary database."""
-    db = tmp_path / "test.db"
-    s = MemoryStore(db_path=db)
-    yield s
-    s.close()
-
-
 @pytest.fixture
 def retriever(store):
     """Create a retriever with no embedding function."""
@@ -22,34 +13,29 @@ def retriever(store):
 
 
 class TestFTS5OnlySearch:
-    @pytest.mark.asyncio
     async def test_search_finds_by_keyword(self, store, retriever):
         store.store_memory("hobby", "programming")
         results = await retriever.search("programming")
         assert len(results) >= 1
         assert results[0]["key"] == "hobby"
 
-    @pytest.mark.asyncio
     async def test_search_empty_db(self, retriever):
         results = await retriever.search("anything")
         assert results == []
 
-    @pytest.mark.asyncio
-    async def test_search_respects_top_k(self, store, retriever):
-        for i in range(10):
-            store.store_memory(f"fact{i}", f"value about item {i}")
+    async def test_search_respects_top_k(self, populated_store):
+        retriever = MemoryRetriever(memory_store=populated_store)
         results = await retriever.search("item")
-        assert len(results) <= retriever.TOP_K
+        assert len(results) == retriever.TOP_K
 
 
 class TestHybridSearch:
-    @pytest.mark.asyncio
     async def test_vector_search_combined(self, store):
         store.store_memory("color", "blue")
-        store.store_embedding("color", [1.0, 0.0, 0.0])
+        store.store_embedding("color", np.array([1.0, 0.0, 0.0], dtype=np.float32))
 
-        async def mock_embed(text):
-            return [1.0, 0.0, 0.0]
+        def mock_embed(text):
+            return np.array([1.0, 0.0, 0.0], dtype=np.float32)
 
         retriever = MemoryRetriever(
             memory_store=store, embedding_fn=mock_embed,
@@ -59,7 +45,19 @@ class TestHybridSearch:
         # Should have both keyword and vector scores
         assert results[0]["vector_score"] > 0
 
-    @pytest.mark.asyncio
+    async def test_async_embedding_fn_awaited(self, store):
+        store.store_memory("color", "blue")
+        store.store_embedding("color", [0.0, 1.0])
+
+        async def mock_embed(text):
+            return [0.0, 1.0]
+
+        retriever = MemoryRetriever(
+            memory_store=store, embedding_fn=mock_embed,
+        )
+        results = await retriever.search("blue")
+        assert results[0]["vector_score"] == pytest.approx(1.0)
+
     async def test_vector_fallback_on_error(self, store):
         store.store_memory("test", "value")
 
@@ -75,7 +73,6 @@ class TestHybridSearch:
 
 
 class TestFormatting:
-    @pytest.mark.asyncio
     async def test_format_for_prompt(self, store, retriever):
         store.store_memory("name", "Zhafran")
         store.store_memory("city", "Bekasi")
@@ -88,20 +85,29 @@ class TestFormatting:
 
 
 class TestCosineSimilarity:
-    def test_identical_vectors(self):
-        sim = MemoryRetriever._cosine_similarity(
-            [1.0, 0.0], [1.0, 0.0],
-        )
-        assert abs(sim - 1.0) < 1e-6
-
-    def test_orthogonal_vectors(self):
-        sim = MemoryRetriever._cosine_similarity(
-            [1.0, 0.0], [0.0, 1.0],
-        )
-        assert abs(sim) < 1e-6
-
-    def test_zero_vector(self):
-        sim = MemoryRetriever._cosine_similarity(
-            [0.0, 0.0], [1.0, 0.0],
+    @pytest.mark.parametrize(
+        ("a", "b", "expected"),
+        [
+            pytest.param([1.0, 0.0], [1.0, 0.0], 1.0, id="identical"),
+            pytest.param([1.0, 0.0], [0.0, 1.0], 0.0, id="orthogonal"),
+            pytest.param([1.0, 0.0], [-1.0, 0.0], -1.0, id="opposite"),
+            pytest.param([0.0, 0.0], [1.0, 0.0], 0.0, id="zero_vector"),
+            pytest.param([3.0, 4.0], [6.0, 8.0], 1.0, id="scaled"),
+        ],
+    )
+    def test_known_values(self, a, b, expected):
+        sim = MemoryRetriever._cosine_similarity(a, b)
+        assert sim == pytest.approx(expected, abs=1e-6)
+
+    def test_matches_numpy_reference(self):
+        rng = np.random.default_rng(0)
+        a = rng.standard_normal((200, 16))
+        b = rng.standard_normal((200, 16))
+        expected = np.einsum("ij,ij->i", a, b) / (
+            np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
         )
-        assert sim == 0.0
+        actual = [
+            MemoryRetriever._cosine_similarity(x.tolist(), y.tolist())
+            for x, y in zip(a, b)
+        ]
+        np.testing.assert_allclose(actual, expected, atol=1e-9)
@@ -63,9 +63,20 @@ class MockFailThenSucceedProvider:
         return self._result
 
 
+@pytest.fixture
+def make_router():
+    """Factory building a ProviderRouter over the given providers."""
+
+    def _make(*providers, provider_type: str = "LLM") -> ProviderRouter:
+        return ProviderRouter(provider_type, list(providers))
+
+    return _make
+
+
 # --- Tests ---
 
 
+@pytest.mark.fast
 class TestProviderRouterInit:
     def test_requires_at_least_one_provider(self):
         with pytest.raises(ValueError, match="At least one"):
@@ -78,11 +89,10 @@ class TestProviderRouterInit:
 
 
 class TestPrimaryProviderSuccess:
-    @pytest.mark.asyncio
-    async def test_primary_succeeds_returns_result(self):
+    async def test_primary_succeeds_returns_result(self, make_router):
         primary = MockProvider("primary", result="hello")
         fallback = MockProvider("fallback", result="backup")
-        router = ProviderRouter("LLM", [primary, fallback])
+        router = make_router(primary, fallback)
 
         result = await router.execute("do_work")
 
@@ -90,8 +100,7 @@ class TestPrimaryProviderSuccess:
         assert primary.call_count == 1
         assert fallback.call_count == 0
 
-    @pytest.mark.asyncio
-    async def test_passes_args_to_provider(self):
+    async def test_passes_args_to_provider(self, make_router):
         class ArgCapture:
             name = "capture"
             call_count = 0
@@ -101,7 +110,7 @@ class TestPrimaryProviderSuccess:
                 return "done"
 
         provider = ArgCapture()
-        router = ProviderRouter("TTS", [provider])
+        router = make_router(provider, provider_type="TTS")
 
         await router.execute("do_work", "hello", language="id")
 
@@ -109,13 +118,12 @@ class TestPrimaryProviderSuccess:
 
 
 class TestFailoverBehavior:
-    @pytest.mark.asyncio
-    async def test_rate_limit_falls_back_to_next(self):
+    async def test_rate_limit_falls_back_to_next(self, make_router):
         primary = MockFailProvider(
             "primary", RateLimitError("primary", retry_after=5.0)
         )
         fallback = MockProvider("fallback", result="from-fallback")
-        router = ProviderRouter("LLM", [primary, fallback])
+        router = make_router(primary, fallback)
 
         result = await router.execute("do_work")
 
@@ -123,25 +131,23 @@ class TestFailoverBehavior:
         assert primary.call_count == 1
         assert fallback.call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_timeout_falls_back_to_next(self):
+    async def test_timeout_falls_back_to_next(self, make_router):
         primary = MockFailProvider(
             "primary", ProviderTimeoutError("primary", timeout=10.0)
         )
         fallback = MockProvider("fallback", result="from-fallback")
-        router = ProviderRouter("STT", [primary, fallback])
+        router = make_router(primary, fallback, provider_type="STT")
 
         result = await router.execute("do_work")
 
         assert result == "from-fallback"
 
-    @pytest.mark.asyncio
-    async def test_generic_error_falls_back_to_next(self):
+    async def test_generic_error_falls_back_to_next(self, make_router):
         primary = MockFailProvider(
             "primary", ProviderError("primary", "API error")
         )
         fallback = MockProvider("fallback", result="recovered")
-        router = ProviderRouter("TTS", [primary, fallback])
+        router = make_router(primary, fallback, provider_type="TTS")
 
         result = await router.execute("do_work")
 
@@ -149,11 +155,10 @@ class TestFailoverBehavior:
 
 
 class TestAllProvidersFailed:
-    @pytest.mark.asyncio
-    async def test_all_fail_raises_all_providers_failed(self):
+    async def test_all_fail_raises_all_providers_failed(self, make_router):
         p1 = MockFailProvider("p1", RateLimitError("p1"))
         p2 = MockFailProvider("p2", ProviderTimeoutError("p2", timeout=5.0))
-        router = ProviderRouter("LLM", [p1, p2])
+        router = make_router(p1, p2)
 
         with pytest.raises(AllProvidersFailedError) as exc_info:
             await router.execute("do_work")
@@ -163,22 +168,42 @@ class TestAllProvidersFailed:
         assert "p1" in str(exc_info.value)
         assert "p2" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_single_provider_fails_raises_error(self):
+    async def test_single_provider_fails_raises_error(self, make_router):
         provider = MockFailProvider("solo", ProviderError("solo", "dead"))
-        router = ProviderRouter("STT", [provider])
+        router = make_router(provider, provider_type="STT")
 
         with pytest.raises(AllProvidersFailedError):
             await router.execute("do_work")
 
 
 class TestBackoffBehavior:
-    @pytest.mark.asyncio
-    async def test_failed_provider_skipped_on_next_call(self):
+    def test_backoff_schedule_doubles_and_caps(self, make_router, monkeypatch):
+        router = make_router(MockProvider("p"))
+        monkeypatch.setattr(router, "_now", lambda: 100.0)
+
+        delays = []
+        for _ in range(6):
+            router._record_failure("p")
+            delays.append(router._get_backoff_delay("p"))
+
+        assert delays == [1.0, 2.0, 4.0, 8.0, 16.0, 16.0]
+        assert "p" in router._banned
+
+    def test_backoff_forgotten_after_reset_window(self, make_router, monkeypatch):
+        router = make_router(MockProvider("p"))
+        monkeypatch.setattr(router, "_now", lambda: 100.0)
+        router._record_failure("p")
+
+        monkeypatch.setattr(router, "_now", lambda: 161.0)
+        assert router._get_backoff_delay("p") == 0.0
+        assert "p" not in router._banned
+        assert router._failures == {}
+
+    async def test_failed_provider_skipped_on_next_call(self, make_router):
         """After a failure, the provider should be in backoff on the next call."""
         primary = MockFailProvider("primary", RateLimitError("primary"))
         fallback = MockProvider("fallback", result="ok")
-        router = ProviderRouter("LLM", [primary, fallback])
+        router = make_router(primary, fallback)
 
         # First call: primary fails, fallback succeeds
         await router.execute("do_work")
@@ -190,8 +215,7 @@ class TestBackoffBehavior:
         assert primary.call_count == 1  # not called again
         assert fallback.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_success_resets_backoff(self):
+    async def test_success_resets_backoff(self, make_router, monkeypatch):
         """A successful call should reset backoff for that provider."""
         provider = MockFailThenSucceedProvider(
             "flaky", fail_count=1,
@@ -199,56 +223,61 @@ class TestBackoffBehavior:
             result="recovered",
         )
         fallback = MockProvider("fallback", result="backup")
-        router = ProviderRouter("LLM", [provider, fallback])
+        router = make_router(provider, fallback)
 
         # First call: flaky fails, fallback succeeds
         result1 = await router.execute("do_work")
         assert result1 == "backup"
 
-        # Manually reset backoff to simulate time passing
-        router._backoff.clear()
+        # Jump past the 60s backoff reset window
+        monkeypatch.setattr(router, "_now", lambda: 9e9)
 
         # Second call: flaky succeeds now, backoff should be cleared
         result2 = await router.execute("do_work")
         assert result2 == "recovered"
-        assert provider.name not in router._backoff
+        assert provider.name not in router._banned
 
 
+@pytest.mark.fast
 class TestExceptionHierarchy:
-    def test_rate_limit_is_provider_error(self):
-        e = RateLimitError("test")
-        assert isinstance(e, ProviderError)
-
-    def test_timeout_is_provider_error(self):
-        e = ProviderTimeoutError("test", timeout=5.0)
-        assert isinstance(e, ProviderError)
-
-    def test_rate_limit_includes_retry_after(self):
-        e = RateLimitError("test", retry_after=30.0)
-        assert e.retry_after == 30.0
-        assert "30.0s" in str(e)
+    @pytest.mark.parametrize("exc_type", [RateLimitError, ProviderTimeoutError])
+    def test_is_provider_error(self, exc_type):
+        assert issubclass(exc_type, ProviderError)
+
+    @pytest.mark.parametrize(
+        ("exc", "attr", "value", "fragments"),
+        [
+            pytest.param(
+                RateLimitError("test", retry_after=30.0),
+                "retry_after", 30.0, ("30.0s",),
+                id="rate_limit_includes_retry_after",
+            ),
+            pytest.param(
+                ProviderTimeoutError("test", timeout=10.0),
+                "timeout", 10.0, ("10.0s",),
+                id="timeout_includes_duration",
+            ),
+            pytest.param(
+                ProviderError("gemini", "something broke"),
+                "provider_name", "gemini", ("[gemini]",),
+                id="provider_error_includes_name",
+            ),
+            pytest.param(
+                AllProvidersFailedError(
+                    "LLM",
+                    [RateLimitError("gemini"), ProviderTimeoutError("groq", timeout=5.0)],
+                ),
+                "provider_type", "LLM", ("gemini", "groq"),
+                id="all_providers_failed_lists_names",
+            ),
+        ],
+    )
+    def test_attribute_and_message(self, exc, attr, value, fragments):
+        assert getattr(exc, attr) == value
+        for fragment in fragments:
+            assert fragment in str(exc)
 
     def test_rate_limit_without_retry_after(self):
         e = RateLimitError("test")
         assert e.retry_after is None
         assert "retry after" not in str(e)
-
-    def test_timeout_includes_duration(self):
-        e = ProviderTimeoutError("test", timeout=10.0)
-        assert e.timeout == 10.0
-        assert "10.0s" in str(e)
-
-    def test_all_providers_failed_lists_names(self):
-        errors = [
-            RateLimitError("gemini"),
-            ProviderTimeoutError("groq", timeout=5.0),
-        ]
-        e = AllProvidersFailedError("LLM", errors)
-        assert "gemini" in str(e)
-        assert "groq" in str(e)
-        assert e.provider_type == "LLM"
-
-    def test_provider_error_includes_name(self):
-        e = ProviderError("gemini", "something broke")
-        assert e.provider_name == "gemini"
-        assert "[gemini]" in str(e)
@@ -1,161 +1,230 @@
 """Tests for streaming TTS — sentence splitting and overlapped playback."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
 
 import pytest
 
 from nova.audio.streaming_tts import StreamingTTSPlayer, split_sentences
 
 
+class StubRouter:
+    """A stand-in TTS ProviderRouter that records ``execute`` calls.
+
+    Each call consumes the next preset result; the last one repeats once
+    the list is exhausted. Exceptions are raised, anything else is
+    returned as the synthesized audio.
+    """
+
+    def __init__(self, *results) -> None:
+        self.results = results
+        self.calls: list[tuple] = []
+
+    async def execute(self, *args):
+        result = self.results[min(len(self.calls), len(self.results) - 1)]
+        self.calls.append(args)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def played(monkeypatch):
+    """Replace play_audio with a recorder; returns the played chunks."""
+    chunks: list[bytes] = []
+
+    async def fake_play(audio):
+        chunks.append(audio)
+
+    monkeypatch.setattr("nova.audio.streaming_tts.play_audio", fake_play)
+    return chunks
+
+
+@pytest.mark.fast
 class TestSplitSentences:
-    def test_empty_string(self):
-        assert split_sentences("") == []
-
-    def test_single_sentence_no_period(self):
-        assert split_sentences("Halo saya Nova") == ["Halo saya Nova"]
-
-    def test_single_sentence_with_period(self):
-        assert split_sentences("Halo saya Nova.") == ["Halo saya Nova."]
-
-    def test_two_short_sentences_merged(self):
-        # Both sentences are < 40 chars, so they get merged into one
-        result = split_sentences("Halo saya Nova. Saya bisa membantu Anda.")
-        assert len(result) == 1
-        assert "Halo saya Nova." in result[0]
-        assert "Saya bisa membantu Anda." in result[0]
-
-    def test_exclamation_and_question(self):
-        result = split_sentences("Halo! Apa kabar? Saya baik.")
-        # All fragments are < 40 chars — everything merges into one
-        assert len(result) == 1
-        assert "Halo!" in result[0]
-        assert "Apa kabar?" in result[0]
-        assert "Saya baik." in result[0]
-
-    def test_abbreviation_not_split(self):
-        result = split_sentences("Dr. Budi mengatakan hal penting.")
-        # "Dr." should NOT be a sentence break
-        assert len(result) == 1
-        assert "Dr." in result[0]
-
-    def test_dll_abbreviation(self):
-        result = split_sentences(
-            "Ada buku, pensil, dll. yang perlu dibeli. Jangan lupa."
-        )
-        # "dll." should NOT be a sentence break, and total < 40 chars per part
-        # so everything merges into one
-        assert len(result) == 1
-        assert "dll." in result[0]
-
-    def test_short_fragment_merged(self):
-        result = split_sentences("Ok. Saya akan membantu Anda sekarang.")
-        # "Ok." is too short (<10 chars), should be merged
-        assert len(result) == 1
-        assert "Ok." in result[0]
-
-    def test_multiple_long_sentences(self):
-        text = (
-            "Baterai Anda saat ini di 75 persen. "
-            "Sedang mengisi daya melalui kabel USB. "
-            "Diperkirakan penuh dalam satu jam."
-        )
-        result = split_sentences(text)
-        # Each sentence is ~35 chars (< 40), so first merges with second (now > 40),
-        # but the merge logic keeps accumulating into the buffer.
-        # The buffer after first two merges is > 70 chars, so third merges as
-        # trailing fragment (< 40 chars). Result: 1 sentence.
-        assert len(result) == 1
-
-    def test_preserves_content(self):
-        text = "Halo! Saya Nova. Senang berkenalan!"
-        result = split_sentences(text)
-        joined = " ".join(result)
-        # All original words should be present
-        for word in ["Halo!", "Saya", "Nova.", "Senang", "berkenalan!"]:
-            assert word in joined
-
-    def test_whitespace_only(self):
-        assert split_sentences("   ") == []
-
-    def test_decimal_number_not_split(self):
-        result = split_sentences("Harganya 3.500 rupiah. Cukup murah.")
-        # "3.500" should NOT cause a split, and both parts are < 40 chars
-        # so they merge into one
-        assert len(result) == 1
-        assert "3.500" in result[0]
-
-    def test_short_sentences_merged_under_40(self):
-        """Short sentences (< 40 chars) merge to reduce TTS API calls."""
-        result = split_sentences(
-            "Mohon maaf, Tuan. Anda benar, ini sudah sore."
-        )
-        # Both fragments are < 40 chars → merged into one
-        assert len(result) == 1
-        assert result[0] == "Mohon maaf, Tuan. Anda benar, ini sudah sore."
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            pytest.param("", [], id="empty_string"),
+            pytest.param("   ", [], id="whitespace_only"),
+            pytest.param(
+                "Halo saya Nova", ["Halo saya Nova"], id="single_no_period",
+            ),
+            pytest.param(
+                "Halo saya Nova.", ["Halo saya Nova."], id="single_with_period",
+            ),
+            # Fragments < 40 chars merge with the next to reduce TTS API calls
+            pytest.param(
+                "Halo saya Nova. Saya bisa membantu Anda.",
+                ["Halo saya Nova. Saya bisa membantu Anda."],
+                id="two_short_merged",
+            ),
+            pytest.param(
+                "Mohon maaf, Tuan. Anda benar, ini sudah sore.",
+                ["Mohon maaf, Tuan. Anda benar, ini sudah sore."],
+                id="short_merged_under_40",
+            ),
+            pytest.param(
+                "Halo! Apa kabar? Saya baik.",
+                ["Halo! Apa kabar? Saya baik."],
+                id="exclamation_and_question",
+            ),
+            pytest.param(
+                "Ok. Saya akan membantu Anda sekarang.",
+                ["Ok. Saya akan membantu Anda sekarang."],
+                id="short_fragment_merged",
+            ),
+            pytest.param(
+                "Halo! Saya Nova. Senang berkenalan!",
+                ["Halo! Saya Nova. Senang berkenalan!"],
+                id="preserves_content",
+            ),
+            # Each ~35 chars: the buffer keeps growing, and the < 40 char
+            # trailing sentence merges into it → one sentence
+            pytest.param(
+                "Baterai Anda saat ini di 75 persen. "
+                "Sedang mengisi daya melalui kabel USB. "
+                "Diperkirakan penuh dalam satu jam.",
+                [
+                    "Baterai Anda saat ini di 75 persen. "
+                    "Sedang mengisi daya melalui kabel USB. "
+                    "Diperkirakan penuh dalam satu jam.",
+                ],
+                id="multiple_long_sentences",
+            ),
+            # Both sentences >= 40 chars → kept separate
+            pytest.param(
+                "Baterai laptop Anda saat ini sedang terisi penuh. "
+                "Sedang mengisi daya melalui kabel USB yang terhubung.",
+                [
+                    "Baterai laptop Anda saat ini sedang terisi penuh.",
+                    "Sedang mengisi daya melalui kabel USB yang terhubung.",
+                ],
+                id="two_long_split",
+            ),
+            # Abbreviations and decimals are not sentence breaks
+            pytest.param(
+                "Dr. Budi mengatakan hal penting.",
+                ["Dr. Budi mengatakan hal penting."],
+                id="abbreviation_not_split",
+            ),
+            pytest.param(
+                "Ada buku, pensil, dll. yang perlu dibeli. Jangan lupa.",
+                ["Ada buku, pensil, dll. yang perlu dibeli. Jangan lupa."],
+                id="dll_abbreviation",
+            ),
+            # Long enough to flush, so only the abbreviation rule keeps it whole
+            pytest.param(
+                "Saya sudah membeli buku, pensil, kertas, dll. "
+                "Kemudian saya pulang ke rumah dengan cepat.",
+                [
+                    "Saya sudah membeli buku, pensil, kertas, dll. "
+                    "Kemudian saya pulang ke rumah dengan cepat.",
+                ],
+                id="abbreviation_after_long_buffer",
+            ),
+            pytest.param(
+                "Harganya 3.500 rupiah. Cukup murah.",
+                ["Harganya 3.500 rupiah. Cukup murah."],
+                id="decimal_number_not_split",
+            ),
+        ],
+    )
+    def test_split_sentences(self, text, expected):
+        assert split_sentences(text) == expected
 
 
 class TestStreamingTTSPlayer:
-    @pytest.mark.asyncio
     async def test_empty_text_returns_zero(self):
         player = StreamingTTSPlayer()
-        mock_router = AsyncMock()
-        result = await player.synthesize_and_play("", mock_router, "id")
+        router = StubRouter(b"fake-audio-bytes")
+        result = await player.synthesize_and_play("", router, "id")
         assert result == 0.0
-        mock_router.execute.assert_not_called()
+        assert router.calls == []
 
-    @pytest.mark.asyncio
-    async def test_single_sentence_calls_tts_once(self):
+    async def test_single_sentence_calls_tts_once(self, played):
         player = StreamingTTSPlayer()
-        mock_router = AsyncMock()
-        mock_router.execute.return_value = b"fake-audio-bytes"
-
-        with patch("nova.audio.streaming_tts.play_audio", new_callable=AsyncMock):
-            result = await player.synthesize_and_play(
-                "Halo saya Nova.", mock_router, "id",
-            )
+        router = StubRouter(b"fake-audio-bytes")
 
-        assert result > 0.0
-        mock_router.execute.assert_called_once_with(
-            "synthesize", "Halo saya Nova.", "id",
+        result = await player.synthesize_and_play(
+            "Halo saya Nova.", router, "id",
         )
 
-    @pytest.mark.asyncio
-    async def test_multi_sentence_calls_tts_per_sentence(self):
-        player = StreamingTTSPlayer()
-        mock_router = AsyncMock()
-        mock_router.execute.return_value = b"fake-audio-bytes"
-
-        # Use long sentences (>= 40 chars each) so they don't merge
-        with patch("nova.audio.streaming_tts.play_audio", new_callable=AsyncMock):
-            result = await player.synthesize_and_play(
+        assert result > 0.0
+        assert router.calls == [("synthesize", "Halo saya Nova.", "id")]
+        assert played == [b"fake-audio-bytes"]
+
+    @pytest.mark.parametrize(
+        ("text", "expected_calls"),
+        [
+            # Both sentences are < 40 chars → merged into one TTS call
+            pytest.param(
+                "Halo saya Nova. Saya bisa membantu Anda.", 1, id="merged",
+            ),
+            # Both sentences are >= 40 chars, so they stay separate → 2 TTS calls
+            pytest.param(
                 "Baterai laptop Anda saat ini sedang terisi penuh. "
                 "Sedang mengisi daya melalui kabel USB yang terhubung.",
-                mock_router, "id",
-            )
+                2,
+                id="separate",
+            ),
+        ],
+    )
+    async def test_multi_sentence_calls_tts_per_sentence(
+        self, played, text, expected_calls,
+    ):
+        player = StreamingTTSPlayer()
+        router = StubRouter(b"fake-audio-bytes")
+
+        result = await player.synthesize_and_play(text, router, "id")
 
         assert result > 0.0
-        # Both sentences are >= 40 chars, so they stay separate → 2 TTS calls
-        assert mock_router.execute.call_count == 2
+        assert len(router.calls) == expected_calls
+        assert len(played) == expected_calls
 
-    @pytest.mark.asyncio
-    async def test_synthesis_failure_skips_sentence(self):
+    async def test_synthesis_failure_skips_sentence(self, played):
         player = StreamingTTSPlayer()
-        mock_router = AsyncMock()
         # First call fails, second succeeds
-        mock_router.execute.side_effect = [
-            Exception("TTS error"),
-            b"fake-audio-bytes",
-        ]
+        router = StubRouter(Exception("TTS error"), b"fake-audio-bytes")
 
         # Use long sentences (>= 40 chars) so they don't merge
-        with patch(
-            "nova.audio.streaming_tts.play_audio", new_callable=AsyncMock,
-        ) as mock_play:
-            await player.synthesize_and_play(
-                "Kalimat pertama ini akan mengalami kegagalan. "
-                "Kalimat kedua ini berhasil disintesis dengan baik.",
-                mock_router, "id",
-            )
+        await player.synthesize_and_play(
+            "Kalimat pertama ini akan mengalami kegagalan. "
+            "Kalimat kedua ini berhasil disintesis dengan baik.",
+            router, "id",
+        )
 
         # Only the second sentence should have been played
-        mock_play.assert_called_once_with(b"fake-audio-bytes")
+        assert played == [b"fake-audio-bytes"]
+
+    async def test_synthesis_overlaps_playback(self, monkeypatch):
+        """Sentence N+1 is synthesized while sentence N is still playing."""
+        first = "Baterai laptop Anda saat ini sedang terisi penuh."
+        second = "Sedang mengisi daya melalui kabel USB yang terhubung."
+        events: list[tuple[str, str]] = []
+
+        class RecordingRouter:
+            async def execute(self, method, text, language):
+                events.append(("synth_start", text))
+                await asyncio.sleep(0)
+                events.append(("synth_end", text))
+                return text.encode()
+
+        async def fake_play(audio):
+            events.append(("play_start", audio.decode()))
+            await asyncio.sleep(0)
+            events.append(("play_end", audio.decode()))
+
+        monkeypatch.setattr("nova.audio.streaming_tts.play_audio", fake_play)
+
+        await StreamingTTSPlayer().synthesize_and_play(
+            f"{first} {second}", RecordingRouter(), "id",
+        )
+
+        assert [e for e in events if e[0] == "play_start"] == [
+            ("play_start", first), ("play_start", second),
+        ]
+        # The two intervals must overlap: synthesize-then-play-each would
+        # finish `first` before synthesizing `second`, and synthesize-all-
+        # then-play would finish `second` before playing anything
+        assert events.index(("synth_start", second)) < events.index(("play_end", first))
+        assert events.index(("play_start", first)) < events.index(("synth_end", second))
@@ -1,108 +1,151 @@
 """Tests for NOVA tools: time_date, system_control, memory, and registry."""
 
-import json
-from unittest.mock import MagicMock, patch
+import inspect
+import subprocess
+import sys
 
 import pytest
-
-from nova.tools import time_date
+from freezegun import freeze_time
+
+from nova.memory.memory_store import MemoryStore
+from nova.memory.persistent import (
+    UserMemory,
+    get_user_memory,
+    recall_facts,
+    remember_fact,
+    reset_user_memory,
+)
+from nova.tools import registry, time_date
+from nova.tools.notes import add_note, clear_notes, get_notes
 from nova.tools.registry import execute_tool, get_all_tool_names, get_tool_declarations
 
 
+@pytest.fixture(scope="session")
+def tool_decls():
+    """The Gemini Tool declarations, built once per session."""
+    return get_tool_declarations()
+
+
+@pytest.fixture(scope="session")
+def tool_names():
+    """All registered tool names as a frozenset for O(1) membership checks."""
+    return frozenset(get_all_tool_names())
+
+
+_EXPECTED_TOOLS = frozenset({
+    "get_current_time", "get_current_date", "get_current_datetime",
+    "volume_up", "volume_down", "mute_unmute",
+    "play_pause_media", "next_track", "previous_track",
+    "open_app", "open_browser", "open_url",
+    "open_terminal", "open_file_manager",
+    "lock_screen", "shutdown_pc", "restart_pc", "sleep_pc",
+    "take_screenshot", "set_timer",
+    "web_search", "remember_fact", "recall_facts",
+    "get_battery_level", "get_ram_usage", "get_storage_info",
+    "get_ip_address", "get_system_uptime",
+    "add_note", "get_notes", "clear_notes",
+    "set_reminder",
+    "dictate",
+    "brightness_up", "brightness_down", "get_brightness",
+    "wifi_on", "wifi_off", "get_wifi_status",
+})
+
+# A Wednesday afternoon; time/date tools see this as datetime.now()
+_FROZEN_NOW = "2024-05-01 13:37:00"
+
+
+@freeze_time(_FROZEN_NOW)
 class TestTimeDateTools:
-    @pytest.mark.asyncio
     async def test_get_current_time_format(self):
-        result = await time_date.get_current_time()
-        # Should be in HH:MM format
-        assert ":" in result
-        parts = result.split(":")
-        assert len(parts) == 2
-        hour, minute = int(parts[0]), int(parts[1])
-        assert 0 <= hour <= 23
-        assert 0 <= minute <= 59
-
-    @pytest.mark.asyncio
+        assert await time_date.get_current_time() == "13:37"
+
     async def test_get_current_date_format(self):
-        result = await time_date.get_current_date()
-        # Should contain a day name and year
-        assert "," in result
-        assert "20" in result  # year 20xx
+        assert await time_date.get_current_date() == "Rabu, 1 Mei 2024"
 
-    @pytest.mark.asyncio
     async def test_get_current_datetime_format(self):
         result = await time_date.get_current_datetime()
-        # Should contain both date and time
-        assert "pukul" in result
-        assert ":" in result
+        assert result == "Rabu, 1 Mei 2024, pukul 13:37"
+
+
+@freeze_time("2024-05-01 23:59:59", auto_tick_seconds=1)
+async def test_get_current_datetime_reads_clock_once():
+    # Every clock read advances a second; two reads would pair
+    # Wednesday's date with Thursday's 00:00
+    result = await time_date.get_current_datetime()
+    assert result == "Rabu, 1 Mei 2024, pukul 23:59"
 
 
 class TestToolRegistry:
-    def test_get_tool_declarations_returns_tools(self):
-        tools = get_tool_declarations()
-        assert len(tools) >= 1
+    def test_get_tool_declarations_returns_tools(self, tool_decls):
+        assert len(tool_decls) >= 1
         # Each tool should be a google.genai types.Tool
-        tool = tools[0]
+        tool = tool_decls[0]
         assert hasattr(tool, "function_declarations")
         assert len(tool.function_declarations) > 0
 
-    def test_get_all_tool_names(self):
-        names = get_all_tool_names()
-        expected = [
-            "get_current_time", "get_current_date", "get_current_datetime",
-            "volume_up", "volume_down", "mute_unmute",
-            "play_pause_media", "next_track", "previous_track",
-            "open_app", "open_browser", "open_url",
-            "open_terminal", "open_file_manager",
-            "lock_screen", "shutdown_pc", "restart_pc", "sleep_pc",
-            "take_screenshot", "set_timer",
-            "web_search", "remember_fact", "recall_facts",
-            # New tools
-            "get_battery_level", "get_ram_usage", "get_storage_info",
-            "get_ip_address", "get_system_uptime",
-            "add_note", "get_notes", "clear_notes",
-            "set_reminder",
-            "dictate",
-            "brightness_up", "brightness_down", "get_brightness",
-            "wifi_on", "wifi_off", "get_wifi_status",
-        ]
-        for name in expected:
-            assert name in names, f"{name!r} not in registry"
-
-    @pytest.mark.asyncio
+    @pytest.mark.fast
+    @pytest.mark.parametrize("name", sorted(_EXPECTED_TOOLS))
+    def test_tool_in_registry(self, name, tool_names):
+        assert name in tool_names
+
+    @freeze_time(_FROZEN_NOW)
     async def test_execute_tool_time(self):
-        result = await execute_tool("get_current_time")
-        assert isinstance(result, str)
-        assert ":" in result
+        assert await execute_tool("get_current_time") == "13:37"
 
-    @pytest.mark.asyncio
+    @freeze_time(_FROZEN_NOW)
     async def test_execute_tool_date(self):
-        result = await execute_tool("get_current_date")
-        assert isinstance(result, str)
-        assert len(result) > 5
+        assert await execute_tool("get_current_date") == "Rabu, 1 Mei 2024"
 
-    @pytest.mark.asyncio
     async def test_execute_tool_unknown_raises(self):
         with pytest.raises(ValueError, match="Unknown tool"):
             await execute_tool("nonexistent_tool")
 
-    @pytest.mark.asyncio
     async def test_execute_tool_with_empty_args(self):
         result = await execute_tool("get_current_time", {})
         assert isinstance(result, str)
 
-    def test_all_declared_tools_have_implementations(self):
+    def test_declarations_built_once(self):
+        assert get_tool_declarations() is get_tool_declarations()
+        assert get_all_tool_names() is get_all_tool_names()
+
+    def test_invalidate_rebuilds(self):
+        decls, names = get_tool_declarations(), get_all_tool_names()
+        registry._invalidate()
+        assert get_tool_declarations() is not decls
+        assert get_all_tool_names() is not names
+        assert get_all_tool_names() == names
+
+    def test_every_tool_resolves_to_coroutine(self, tool_names):
+        unresolved = sorted(
+            name for name in tool_names
+            if not inspect.iscoroutinefunction(registry._load_tool(name))
+        )
+        assert not unresolved, f"not async callables: {unresolved}"
+
+    def test_import_defers_tool_modules(self):
+        code = (
+            "import sys, nova.tools.registry; "
+            "print(sorted(m for m in ('psutil', 'ddgs', 'nova.tools.system_info') "
+            "if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        ).stdout
+        assert out.strip() == "[]"
+
+    def test_all_declared_tools_have_implementations(self, tool_decls, tool_names):
         """Every declared function should have a matching implementation."""
-        tools = get_tool_declarations()
-        names = get_all_tool_names()
-        for tool in tools:
-            for fn_decl in tool.function_declarations:
-                assert fn_decl.name in names, (
-                    f"Declared function {fn_decl.name!r} has no implementation"
-                )
+        declared = {
+            fn_decl.name
+            for tool in tool_decls
+            for fn_decl in tool.function_declarations
+        }
+        missing = sorted(declared - tool_names)
+        assert not missing, f"Declared functions have no implementation: {missing}"
 
 
 class TestWebSearchTool:
-    @pytest.mark.asyncio
+    @pytest.mark.network
     async def test_web_search_returns_string(self):
         from nova.tools.web_search import web_search
 
@@ -110,19 +153,17 @@ class TestWebSearchTool:
         assert isinstance(result, str)
         assert len(result) > 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.network
     async def test_web_search_via_registry(self):
         result = await execute_tool("web_search", {"query": "Python programming"})
         assert isinstance(result, str)
         assert len(result) > 0
 
-    def test_web_search_declared_in_registry(self):
-        names = get_all_tool_names()
-        assert "web_search" in names
+    def test_web_search_declared_in_registry(self, tool_names):
+        assert "web_search" in tool_names
 
-    def test_web_search_declaration_has_query_param(self):
-        tools = get_tool_declarations()
-        for tool in tools:
+    def test_web_search_declaration_has_query_param(self, tool_decls):
+        for tool in tool_decls:
             for fn_decl in tool.function_declarations:
                 if fn_decl.name == "web_search":
                     schema = fn_decl.parameters_json_schema
@@ -136,19 +177,14 @@ class TestUserMemory:
     """Tests for persistent user memory (UserMemory class)."""
 
     @pytest.fixture(autouse=True)
-    def _use_tmp_memory(self, tmp_path):
-        """Redirect memory file to a temp dir for test isolation."""
-        mem_file = tmp_path / "memory.json"
-        with (
-            patch("nova.memory.persistent._MEMORY_FILE", mem_file),
-            patch("nova.memory.persistent._MEMORY_DIR", tmp_path),
-            patch("nova.memory.persistent._instance", None),
-        ):
-            yield mem_file
+    def _use_tmp_memory(self, file_store, monkeypatch):
+        """Back the memory singletons with a fresh per-test database."""
+        monkeypatch.setattr("nova.memory.memory_store._instance", file_store)
+        reset_user_memory()
+        yield file_store
+        reset_user_memory()
 
     def test_add_and_get_facts(self):
-        from nova.memory.persistent import UserMemory
-
         mem = UserMemory()
         mem.add_fact("name", "Zhafran")
         mem.add_fact("location", "Bekasi")
@@ -156,16 +192,12 @@ class TestUserMemory:
         assert facts == {"name": "Zhafran", "location": "Bekasi"}
 
     def test_get_fact_single(self):
-        from nova.memory.persistent import UserMemory
-
         mem = UserMemory()
         mem.add_fact("hobby", "guitar")
         assert mem.get_fact("hobby") == "guitar"
         assert mem.get_fact("nonexistent") is None
 
     def test_remove_fact(self):
-        from nova.memory.persistent import UserMemory
-
         mem = UserMemory()
         mem.add_fact("color", "blue")
         assert mem.remove_fact("color") is True
@@ -173,8 +205,6 @@ class TestUserMemory:
         assert mem.get_facts() == {}
 
     def test_clear(self):
-        from nova.memory.persistent import UserMemory
-
         mem = UserMemory()
         mem.add_fact("a", "1")
         mem.add_fact("b", "2")
@@ -183,8 +213,6 @@ class TestUserMemory:
         assert mem.fact_count == 0
 
     def test_persistence_across_instances(self, _use_tmp_memory):
-        from nova.memory.persistent import UserMemory
-
         mem1 = UserMemory()
         mem1.add_fact("name", "Zhafran")
 
@@ -193,49 +221,42 @@ class TestUserMemory:
         assert mem2.get_fact("name") == "Zhafran"
 
     def test_key_normalized_to_lowercase(self):
-        from nova.memory.persistent import UserMemory
-
         mem = UserMemory()
         mem.add_fact("Name", "Zhafran")
         assert mem.get_fact("name") == "Zhafran"
 
-    def test_file_written_as_json(self, _use_tmp_memory):
-        from nova.memory.persistent import UserMemory
-
+    def test_fact_written_to_database(self, _use_tmp_memory):
         mem = UserMemory()
         mem.add_fact("city", "Jakarta")
-        data = json.loads(_use_tmp_memory.read_text(encoding="utf-8"))
-        assert data == {"city": "Jakarta"}
+        reopened = MemoryStore(db_path=_use_tmp_memory._db_path, sync_memory_md=False)
+        try:
+            assert reopened.get_all_memories() == {"city": "Jakarta"}
+        finally:
+            reopened.close()
+
+    def test_get_user_memory_is_singleton(self):
+        mem = get_user_memory()
+        assert get_user_memory() is mem
+        reset_user_memory()
+        assert get_user_memory() is not mem
 
-    @pytest.mark.asyncio
     async def test_remember_fact_tool(self):
-        from nova.memory.persistent import get_user_memory, remember_fact
-
         result = await remember_fact("name", "Zhafran")
         assert "Zhafran" in result
         assert get_user_memory().get_fact("name") == "Zhafran"
 
-    @pytest.mark.asyncio
     async def test_recall_facts_tool(self):
-        from nova.memory.persistent import get_user_memory, recall_facts
-
         get_user_memory().add_fact("name", "Zhafran")
         result = await recall_facts()
         assert "name=Zhafran" in result
 
-    @pytest.mark.asyncio
     async def test_recall_facts_empty(self):
-        from nova.memory.persistent import recall_facts
-
         result = await recall_facts()
         assert "Belum ada" in result
 
-    def test_memory_tools_in_registry(self):
-        names = get_all_tool_names()
-        assert "remember_fact" in names
-        assert "recall_facts" in names
+    def test_memory_tools_in_registry(self, tool_names):
+        assert {"remember_fact", "recall_facts"} <= tool_names
 
-    @pytest.mark.asyncio
     async def test_remember_fact_via_registry(self):
         result = await execute_tool("remember_fact", {"key": "test", "value": "123"})
         assert isinstance(result, str)
@@ -245,7 +266,13 @@ class TestUserMemory:
 class TestSystemInfoTools:
     """Tests for system info tools (psutil-based)."""
 
-    @pytest.mark.asyncio
+    @pytest.fixture(autouse=True)
+    def _fresh_readings(self, monkeypatch):
+        """Start each test with an empty reading cache."""
+        from nova.tools import system_info
+
+        monkeypatch.setattr(system_info, "_cache", {})
+
     async def test_get_battery_level_returns_string(self):
         from nova.tools.system_info import get_battery_level
 
@@ -254,7 +281,6 @@ class TestSystemInfoTools:
         # Should contain "Baterai" or "baterai" or desktop message
         assert "aterai" in result.lower() or "desktop" in result.lower()
 
-    @pytest.mark.asyncio
     async def test_get_ram_usage_returns_string(self):
         from nova.tools.system_info import get_ram_usage
 
@@ -263,7 +289,6 @@ class TestSystemInfoTools:
         assert "RAM" in result
         assert "GB" in result
 
-    @pytest.mark.asyncio
     async def test_get_storage_info_returns_string(self):
         from nova.tools.system_info import get_storage_info
 
@@ -272,7 +297,7 @@ class TestSystemInfoTools:
         assert "Storage" in result or "storage" in result
         assert "GB" in result
 
-    @pytest.mark.asyncio
+    @pytest.mark.network
     async def test_get_ip_address_returns_string(self):
         from nova.tools.system_info import get_ip_address
 
@@ -280,7 +305,6 @@ class TestSystemInfoTools:
         assert isinstance(result, str)
         assert "IP" in result
 
-    @pytest.mark.asyncio
     async def test_get_system_uptime_returns_string(self):
         from nova.tools.system_info import get_system_uptime
 
@@ -288,86 +312,112 @@ class TestSystemInfoTools:
         assert isinstance(result, str)
         assert "menit" in result or "jam" in result
 
-    @pytest.mark.asyncio
+    async def test_readings_cached_within_ttl(self, monkeypatch):
+        import psutil
+
+        from nova.tools import system_info
+        from nova.tools.system_info import get_battery_level, get_ram_usage
+
+        real = psutil.virtual_memory
+        calls = []
+        monkeypatch.setattr(psutil, "virtual_memory", lambda: calls.append(1) or real())
+        monkeypatch.setattr(psutil, "sensors_battery", lambda: calls.append(2))
+
+        assert await get_ram_usage() == await get_ram_usage()
+        await get_battery_level()
+        await get_battery_level()
+        assert calls == [1, 2]
+
+        monkeypatch.setitem(system_info._TTL, "ram", 0.0)
+        await get_ram_usage()
+        assert calls == [1, 2, 1]
+
+    async def test_ip_cached_only_after_public_lookup(self, monkeypatch):
+        from nova.tools.system_info import get_ip_address
+
+        results = iter([
+            "IP lokal: 10.0.0.2, IP publik: tidak tersedia.",
+            "IP lokal: 10.0.0.2, IP publik: 203.0.113.7.",
+        ])
+        lookups = []
+
+        async def lookup():
+            lookups.append(1)
+            return next(results)
+
+        monkeypatch.setattr("nova.tools.system_info._lookup_ip", lookup)
+        assert "tidak tersedia" in await get_ip_address()
+        assert "203.0.113.7" in await get_ip_address()
+        assert "203.0.113.7" in await get_ip_address()
+        assert len(lookups) == 2
+
     async def test_system_info_via_registry(self):
         result = await execute_tool("get_ram_usage")
         assert isinstance(result, str)
         assert "RAM" in result
 
-    def test_system_info_tools_in_registry(self):
-        names = get_all_tool_names()
-        for name in [
+    def test_system_info_tools_in_registry(self, tool_names):
+        assert {
             "get_battery_level", "get_ram_usage", "get_storage_info",
             "get_ip_address", "get_system_uptime",
-        ]:
-            assert name in names, f"{name!r} not in registry"
+        } <= tool_names
 
 
 class TestNotesTools:
     """Tests for quick notes tools."""
 
     @pytest.fixture(autouse=True)
-    def _use_tmp_notes(self, tmp_path):
+    def _use_tmp_notes(self, tmp_path, monkeypatch):
         """Redirect notes file to a temp dir for test isolation."""
         notes_file = tmp_path / "notes.txt"
-        with (
-            patch("nova.tools.notes._NOTES_FILE", notes_file),
-            patch("nova.tools.notes._NOTES_DIR", tmp_path),
-        ):
-            yield notes_file
+        monkeypatch.setattr("nova.tools.notes._NOTES_FILE", notes_file)
+        monkeypatch.setattr("nova.tools.notes._NOTES_DIR", tmp_path)
+        return notes_file
 
-    @pytest.mark.asyncio
     async def test_add_note(self):
-        from nova.tools.notes import add_note
-
         result = await add_note("Beli kopi besok")
         assert "tersimpan" in result.lower()
         assert "Beli kopi besok" in result
 
-    @pytest.mark.asyncio
     async def test_get_notes_empty(self):
-        from nova.tools.notes import get_notes
-
         result = await get_notes()
         assert "Belum ada" in result
 
-    @pytest.mark.asyncio
     async def test_add_and_get_notes(self):
-        from nova.tools.notes import add_note, get_notes
-
         await add_note("Note 1")
         await add_note("Note 2")
         result = await get_notes()
         assert "Note 1" in result
         assert "Note 2" in result
 
-    @pytest.mark.asyncio
-    async def test_clear_notes(self):
-        from nova.tools.notes import add_note, clear_notes, get_notes
+    async def test_get_notes_reads_last_ten_across_blocks(self, monkeypatch):
+        monkeypatch.setattr("nova.tools.notes._TAIL_BLOCK", 16)
+        for i in range(25):
+            await add_note(f"Catatan nomor {i} é")
+        lines = (await get_notes()).splitlines()[1:]
+        assert len(lines) == 10
+        assert lines[0].endswith("Catatan nomor 15 é")
+        assert lines[-1].endswith("Catatan nomor 24 é")
 
+    async def test_clear_notes(self):
         await add_note("Temporary note")
         result = await clear_notes()
         assert "dihapus" in result.lower()
         result = await get_notes()
         assert "Belum ada" in result
 
-    @pytest.mark.asyncio
     async def test_notes_via_registry(self):
         result = await execute_tool("add_note", {"text": "Test note"})
         assert isinstance(result, str)
         assert "tersimpan" in result.lower()
 
-    def test_notes_tools_in_registry(self):
-        names = get_all_tool_names()
-        assert "add_note" in names
-        assert "get_notes" in names
-        assert "clear_notes" in names
+    def test_notes_tools_in_registry(self, tool_names):
+        assert {"add_note", "get_notes", "clear_notes"} <= tool_names
 
 
 class TestRemindersTools:
     """Tests for reminders tool."""
 
-    @pytest.mark.asyncio
     async def test_set_reminder_returns_confirmation(self):
         from nova.tools.reminders import set_reminder
 
@@ -375,14 +425,12 @@ class TestRemindersTools:
         assert "5 menit" in result
         assert "Istirahat" in result
 
-    @pytest.mark.asyncio
     async def test_set_reminder_invalid_time(self):
         from nova.tools.reminders import set_reminder
 
         result = await set_reminder(0, "Test")
         assert "lebih dari 0" in result
 
-    @pytest.mark.asyncio
     async def test_reminder_via_registry(self):
         result = await execute_tool(
             "set_reminder", {"minutes": 10, "message": "Meeting"}
@@ -390,40 +438,44 @@ class TestRemindersTools:
         assert isinstance(result, str)
         assert "10 menit" in result
 
-    def test_reminder_in_registry(self):
-        names = get_all_tool_names()
-        assert "set_reminder" in names
+    def test_reminder_in_registry(self, tool_names):
+        assert "set_reminder" in tool_names
 
 
 class TestDictationTool:
     """Tests for dictation tool."""
 
-    @pytest.mark.asyncio
     async def test_dictate_empty_text(self):
         from nova.tools.dictation import dictate
 
         result = await dictate("")
         assert "Tidak ada" in result
 
-    @pytest.mark.asyncio
-    async def test_dictate_with_mock(self):
+    async def test_dictate_types_text(self, monkeypatch):
+        from nova.tools.dictation import dictate
+
+        monkeypatch.setattr("nova.tools.dictation._FOCUS_DELAY", 0)
+        typed = []
+        result = await dictate("hello world", _typer=typed.append)
+        assert typed == ["hello world"]
+        assert "berhasil" in result.lower()
+
+    async def test_dictate_without_pyautogui(self, monkeypatch):
         from nova.tools.dictation import dictate
 
-        with patch("nova.tools.dictation.pyautogui", create=True) as mock_pyautogui:
-            mock_pyautogui.write = MagicMock()
-            with patch.dict("sys.modules", {"pyautogui": mock_pyautogui}):
-                result = await dictate("hello world")
-                assert "berhasil" in result.lower() or "hello" in result.lower()
+        def missing(text):
+            raise ImportError("pyautogui")
+
+        monkeypatch.setattr("nova.tools.dictation._FOCUS_DELAY", 0)
+        assert "belum terinstall" in await dictate("hello", _typer=missing)
 
-    def test_dictate_in_registry(self):
-        names = get_all_tool_names()
-        assert "dictate" in names
+    def test_dictate_in_registry(self, tool_names):
+        assert "dictate" in tool_names
 
 
 class TestDisplayControlTools:
     """Tests for display brightness tools."""
 
-    @pytest.mark.asyncio
     async def test_brightness_up_returns_string(self):
         from nova.tools.display_control import brightness_up
 
@@ -431,31 +483,25 @@ class TestDisplayControlTools:
         result = await brightness_up()
         assert isinstance(result, str)
 
-    @pytest.mark.asyncio
     async def test_brightness_down_returns_string(self):
         from nova.tools.display_control import brightness_down
 
         result = await brightness_down()
         assert isinstance(result, str)
 
-    @pytest.mark.asyncio
     async def test_get_brightness_returns_string(self):
         from nova.tools.display_control import get_brightness
 
         result = await get_brightness()
         assert isinstance(result, str)
 
-    def test_brightness_tools_in_registry(self):
-        names = get_all_tool_names()
-        assert "brightness_up" in names
-        assert "brightness_down" in names
-        assert "get_brightness" in names
+    def test_brightness_tools_in_registry(self, tool_names):
+        assert {"brightness_up", "brightness_down", "get_brightness"} <= tool_names
 
 
 class TestNetworkControlTools:
     """Tests for network/Wi-Fi tools."""
 
-    @pytest.mark.asyncio
     async def test_get_wifi_status_returns_string(self):
         from nova.tools.network_control import get_wifi_status
 
@@ -463,19 +509,38 @@ class TestNetworkControlTools:
         assert isinstance(result, str)
         assert "Wi-Fi" in result or "wifi" in result.lower()
 
-    def test_network_tools_in_registry(self):
-        names = get_all_tool_names()
-        assert "wifi_on" in names
-        assert "wifi_off" in names
-        assert "get_wifi_status" in names
+    def test_network_tools_in_registry(self, tool_names):
+        assert {"wifi_on", "wifi_off", "get_wifi_status"} <= tool_names
+
+
+@pytest.fixture(scope="session")
+def beep():
+    """The default activation beep, generated once per session."""
+    from nova.audio.wake_word import generate_beep
 
+    return generate_beep()
 
+
+@pytest.mark.fast
 class TestWakeWordBeepGeneration:
-    def test_generate_beep_returns_wav_bytes(self):
-        from nova.audio.wake_word import generate_beep
-        beep = generate_beep()
+    def test_generate_beep_returns_wav_bytes(self, beep):
         assert isinstance(beep, bytes)
         # WAV files start with "RIFF"
         assert beep[:4] == b"RIFF"
         # Should be more than just a header
         assert len(beep) > 44
+
+    def test_generate_beep_is_cached(self, beep):
+        from nova.audio.wake_word import generate_beep
+
+        assert generate_beep() is beep
+        assert generate_beep(frequency=880.0) is not beep
+
+    def test_generate_beep_fades_in_and_out(self, beep):
+        import numpy as np
+
+        samples = np.frombuffer(beep[44:], dtype="<i2")
+        assert len(samples) == int(16000 * 0.2)
+        assert samples[0] == 0
+        assert abs(int(samples[-1])) < 100
+        assert np.abs(samples).max() <= int(0.3 * 32767)